@@ -3,11 +3,14 @@ Configuration settings for People on the Move application.
 Loads environment variables from .env file.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
-load_dotenv()
+# (set POTM_SKIP_DOTENV=1 where the platform already provides them)
+if not os.getenv("POTM_SKIP_DOTENV"):
+    load_dotenv()
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -36,6 +39,11 @@ FLASK_DEBUG = os.getenv("FLASK_DEBUG", "false").lower() == "true"
 # News aggregation settings
 NEWS_FETCH_DAYS = 7  # How many days back to search
 MAX_ARTICLES_PER_SOURCE = 50  # Limit articles per RSS feed
+FETCH_MAX_WORKERS = 16  # Concurrent feed/company fetches (one request at a time per host)
+HOST_MIN_INTERVAL = 0.5  # Minimum seconds between requests to the same host
+FEED_CACHE_PATH = DATA_DIR / "feed_cache.json"  # ETag/Last-Modified cache for RSS feeds
+FEED_CACHE_MAX_AGE_DAYS = 7  # Drop cached validators for URLs not checked in this long
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))  # Processes for batch parsing (<2 parses in fetch threads)
 DEDUP_THRESHOLD_HOURS = 24  # Consider duplicate if same person/company within this window
 
 # Search queries for finding executive moves
@@ -52,6 +60,7 @@ DEFAULT_HASHTAGS = ["#MeatIndustry", "#PoultryIndustry", "#PeopleOnTheMove", "#L
 # Claude API settings
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
 CLAUDE_MAX_TOKENS = 500
+CLAUDE_CONCURRENCY = 8  # Parallel draft generation requests
 
 # Post generation system prompt
 POST_SYSTEM_PROMPT = """You are a social media writer for Meatingplace, a publication for the meat and poultry industry.
@@ -66,8 +75,9 @@ Do not use exclamation points. Do not say "congratulations" or "excited" or simi
 Do not make up details not provided in the input."""
 
 
+@lru_cache(maxsize=1)
 def validate_config():
-    """Check if required configuration is present."""
+    """Check if required configuration is present. Computed once per process."""
     warnings = []
 
     if not NEWSAPI_KEY:
@@ -76,4 +86,4 @@ def validate_config():
     if not ANTHROPIC_API_KEY:
         warnings.append("ANTHROPIC_API_KEY not set - AI post generation disabled, using templates")
 
-    return warnings
+    return tuple(warnings)
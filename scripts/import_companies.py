@@ -14,6 +14,7 @@ CSV format should have columns:
 import sys
 import csv
 import json
+from collections import defaultdict
 from pathlib import Path
 
 # Add project root to path
@@ -21,16 +22,36 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import click
+from sqlalchemy import select, update
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from config.settings import DATABASE_URL, CONFIG_DIR
-from src.database.models import get_engine, get_session, init_db, Company
+from src.database.models import get_bulk_load_engine, get_session, init_db, Company
+from src.database import operations as db_ops
 
 
 def parse_aliases(alias_string):
     """Parse comma-separated aliases into a list."""
     if not alias_string:
         return []
-    return [a.strip() for a in alias_string.split(',') if a.strip()]
+    return [a for a in (a.strip() for a in alias_string.split(',')) if a]
+
+
+def find_column(fieldnames, candidates):
+    """Return the index of the first header matching one of the candidates."""
+    return next((i for i, c in enumerate(fieldnames) if c.lower() in candidates), None)
+
+
+def get_cell(row, index):
+    """Return a CSV cell by index, or '' if the column is missing or the row is short."""
+    if index is None or index >= len(row):
+        return ''
+    return row[index]
 
 
 def import_from_csv(session, csv_path):
@@ -39,55 +60,89 @@ def import_from_csv(session, csv_path):
     updated = 0
     skipped = 0
 
-    with open(csv_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
+    # Load existing companies once instead of querying per row
+    existing = {
+        row.name: row
+        for row in session.execute(
+            select(Company.id, Company.name, Company.domain, Company.website, Company.aliases)
+        )
+    }
+    new_aliases = defaultdict(set)  # name -> aliases collected across the file
+    to_insert = {}  # name -> row dict for new companies
+    to_update = {}  # company id -> changed column values
+
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None) or []
 
         # Normalize column names (handle various casings)
-        fieldnames = reader.fieldnames
-        name_col = next((c for c in fieldnames if c.lower() in ['name', 'company', 'company_name']), None)
-        domain_col = next((c for c in fieldnames if c.lower() in ['domain', 'email_domain']), None)
-        website_col = next((c for c in fieldnames if c.lower() in ['website', 'url', 'company_url']), None)
-        aliases_col = next((c for c in fieldnames if c.lower() in ['aliases', 'alias', 'other_names']), None)
+        name_col = find_column(fieldnames, ['name', 'company', 'company_name'])
+        domain_col = find_column(fieldnames, ['domain', 'email_domain'])
+        website_col = find_column(fieldnames, ['website', 'url', 'company_url'])
+        aliases_col = find_column(fieldnames, ['aliases', 'alias', 'other_names'])
 
-        if not name_col:
+        if name_col is None:
             raise ValueError(f"CSV must have a 'name' or 'company' column. Found: {fieldnames}")
 
         for row in reader:
-            name = row.get(name_col, '').strip()
+            name = get_cell(row, name_col).strip()
             if not name:
                 continue
 
-            domain = row.get(domain_col, '').strip() if domain_col else None
-            website = row.get(website_col, '').strip() if website_col else None
-            aliases_str = row.get(aliases_col, '') if aliases_col else ''
+            domain = get_cell(row, domain_col).strip() if domain_col is not None else None
+            website = get_cell(row, website_col).strip() if website_col is not None else None
+            aliases_str = get_cell(row, aliases_col)
             aliases = parse_aliases(aliases_str)
 
-            # Check if company exists
-            existing = session.query(Company).filter(Company.name == name).first()
+            existing_row = existing.get(name)
+            pending = to_insert.get(name)
+            if aliases:
+                new_aliases[name].update(aliases)
 
-            if existing:
+            if existing_row:
                 # Update if new data provided
-                if domain and not existing.domain:
-                    existing.domain = domain
-                if website and not existing.website:
-                    existing.website = website
-                if aliases:
-                    current = existing.get_aliases()
-                    combined = list(set(current + aliases))
-                    existing.set_aliases(combined)
+                changes = to_update.setdefault(existing_row.id, {'id': existing_row.id})
+                if domain and not (changes.get('domain') or existing_row.domain):
+                    changes['domain'] = domain
+                if website and not (changes.get('website') or existing_row.website):
+                    changes['website'] = website
+                updated += 1
+            elif pending:
+                # Repeated row for a company added earlier in this file
+                if domain and not pending['domain']:
+                    pending['domain'] = domain
+                if website and not pending['website']:
+                    pending['website'] = website
                 updated += 1
             else:
                 # Create new company
-                company = Company(
-                    name=name,
-                    domain=domain,
-                    website=website,
-                )
-                if aliases:
-                    company.set_aliases(aliases)
-                session.add(company)
+                to_insert[name] = {
+                    'name': name,
+                    'domain': domain,
+                    'website': website,
+                    'aliases': None,
+                }
                 added += 1
 
+        # Merge collected aliases once per company
+        for name, aliases in new_aliases.items():
+            if name in to_insert:
+                to_insert[name]['aliases'] = list(aliases)
+                continue
+            existing_row = existing[name]
+            current = json.loads(existing_row.aliases) if existing_row.aliases else []
+            aliases.update(current)
+            to_update[existing_row.id]['aliases'] = json.dumps(list(aliases))
+
+        inserted = db_ops.bulk_create_companies(session, list(to_insert.values()))
+        # Names inserted by someone else since existing was loaded
+        skipped += added - inserted
+        added = inserted
+
+        changed_rows = [changes for changes in to_update.values() if len(changes) > 1]
+        if changed_rows:
+            session.execute(update(Company), changed_rows)
+
         session.commit()
 
     return added, updated, skipped
@@ -95,37 +150,79 @@ def import_from_csv(session, csv_path):
 
 def import_from_json(session, json_path):
     """Import companies from JSON file."""
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
-    added = 0
     skipped = 0
 
+    existing_names = set(session.scalars(select(Company.name)))
+    new_rows = []
+
     for company_data in data.get('companies', []):
         name = company_data.get('name')
         if not name:
             continue
 
-        existing = session.query(Company).filter(Company.name == name).first()
-        if existing:
+        if name in existing_names:
             skipped += 1
             continue
+        existing_names.add(name)
 
-        company = Company(
-            name=name,
-            domain=company_data.get('domain'),
-            website=company_data.get('website'),
-        )
-        if 'aliases' in company_data:
-            company.set_aliases(company_data['aliases'])
-
-        session.add(company)
-        added += 1
+        new_rows.append({
+            'name': name,
+            'domain': company_data.get('domain'),
+            'website': company_data.get('website'),
+            'aliases': company_data.get('aliases'),
+        })
 
+    added = db_ops.bulk_create_companies(session, new_rows)
+    skipped += len(new_rows) - added
     session.commit()
     return added, 0, skipped
 
 
+def dump_json(obj):
+    """Encode obj as JSON bytes indented by 2 spaces, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def export_companies_json(session, json_path):
+    """
+    Write active companies to a companies.json file.
+
+    Rows are streamed from the database and written one record at a time,
+    so memory use does not grow with the number of companies.
+
+    Returns:
+        Number of companies written
+    """
+    result = session.execute(
+        select(Company.name, Company.domain, Company.website, Company.aliases)
+        .where(Company.is_active == True)
+        .execution_options(yield_per=1000)
+    )
+
+    count = 0
+    with open(json_path, 'wb') as f:
+        f.write(b'{\n  "companies": [')
+        for name, domain, website, aliases in result:
+            record = {
+                'name': name,
+                'domain': domain,
+                'website': website,
+                'aliases': json.loads(aliases) if aliases else [],
+            }
+            f.write(b',\n    ' if count else b'\n    ')
+            f.write(dump_json(record).replace(b'\n', b'\n    '))
+            count += 1
+        f.write(b'\n  ]\n}' if count else b']\n}')
+
+    return count
+
+
 @click.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--update-json', is_flag=True, help='Also update config/companies.json')
@@ -138,7 +235,7 @@ def main(input_file, update_json):
     input_path = Path(input_file)
 
     # Initialize database
-    engine = get_engine(DATABASE_URL)
+    engine = get_bulk_load_engine(DATABASE_URL)
     init_db(engine)
     session = get_session(engine)
 
@@ -163,24 +260,9 @@ def main(input_file, update_json):
         # Optionally update companies.json
         if update_json:
             print(f"\nUpdating {CONFIG_DIR / 'companies.json'}...")
-            companies = session.query(Company).filter(Company.is_active == True).all()
-
-            companies_data = {
-                'companies': [
-                    {
-                        'name': c.name,
-                        'domain': c.domain,
-                        'website': c.website,
-                        'aliases': c.get_aliases(),
-                    }
-                    for c in companies
-                ]
-            }
-
-            with open(CONFIG_DIR / 'companies.json', 'w') as f:
-                json.dump(companies_data, f, indent=2)
+            count = export_companies_json(session, CONFIG_DIR / 'companies.json')
 
-            print(f"  Updated with {len(companies)} companies")
+            print(f"  Updated with {count} companies")
 
         # Show total companies
         total = session.query(Company).count()
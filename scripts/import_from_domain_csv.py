@@ -3,19 +3,30 @@
 Import companies from the domain CSV file.
 Maps domains to company names and filters out non-company domains.
 """
+import io
+import re
 import sys
 import csv
+import mmap
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from sqlalchemy import select
+
 from config.settings import DATABASE_URL
-from src.database.models import get_engine, get_session, init_db, Company
+from src.database.models import get_bulk_load_engine, get_session, init_db, Company
+from src.database import operations as db_ops
+
+# Number of new companies to insert per batch while streaming the CSV
+BATCH_SIZE = 1000
 
 # Domains to skip (personal email, generic, etc.)
-SKIP_DOMAINS = {
+SKIP_DOMAINS = frozenset({
     'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
     'icloud.com', 'me.com', 'mac.com', 'live.com', 'msn.com',
     'sbcglobal.net', 'bellsouth.net', 'verizon.net', 'cox.net', 'comcast.net',
@@ -23,10 +34,10 @@ SKIP_DOMAINS = {
     'ymail.com', 'protonmail.com', 'zoho.com',
     # Generic company/email domains
     'rogers.com',  # Telecom
-}
+})
 
 # Domain to company name mapping
-DOMAIN_TO_COMPANY = {
+DOMAIN_TO_COMPANY = MappingProxyType({
     'tyson.com': 'Tyson Foods',
     'cargill.com': 'Cargill',
     'smithfield.com': 'Smithfield Foods',
@@ -192,24 +203,27 @@ DOMAIN_TO_COMPANY = {
     'pfnmeats.com': 'PFN Meats',
     'inpac.com': 'Inpac',
     'stfmail.com': 'STF',
-}
+})
 
+# Trailing TLD labels stripped when generating a name from a domain
+_TLD_RE = re.compile(r'(?:\.(?:com|net|org|co|us|au))+$')
 
+
+@lru_cache(maxsize=None)
 def get_company_name(domain):
     """Get company name from domain, or generate one."""
     if domain in DOMAIN_TO_COMPANY:
         return DOMAIN_TO_COMPANY[domain]
 
     # Generate name from domain
-    name = domain.replace('.com', '').replace('.net', '').replace('.org', '')
-    name = name.replace('.co', '').replace('.us', '').replace('.au', '')
+    name = _TLD_RE.sub('', domain)
     # Capitalize
-    words = name.split('.')
-    name = words[0]
+    name = name.split('.', 1)[0]
     # Convert to title case
     return name.title().replace('Usa', 'USA').replace('Jbs', 'JBS')
 
 
+@lru_cache(maxsize=None)
 def should_skip_domain(domain):
     """Check if domain should be skipped."""
     if domain in SKIP_DOMAINS:
@@ -223,6 +237,21 @@ def should_skip_domain(domain):
     return False
 
 
+def read_csv_rows(csv_path):
+    """
+    Yield CSV rows from a memory-mapped file.
+
+    The mapped file is decoded in a single pass rather than buffer by
+    buffer through the text I/O layer.
+    """
+    with open(csv_path, 'rb') as f:
+        if not f.seek(0, io.SEEK_END):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8-sig')
+    yield from csv.reader(io.StringIO(text, newline=''))
+
+
 def main():
     csv_path = project_root / "Delivery By Receiving Domain (3).csv"
 
@@ -231,7 +260,7 @@ def main():
     print("=" * 50)
 
     # Initialize database
-    engine = get_engine(DATABASE_URL)
+    engine = get_bulk_load_engine(DATABASE_URL)
     init_db(engine)
     session = get_session(engine)
 
@@ -240,41 +269,57 @@ def main():
     already_exists = 0
 
     try:
-        with open(csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
+        # Load existing names and domains once instead of querying per row
+        rows = session.execute(select(Company.name, Company.domain)).all()
+        existing_names = {name for name, _ in rows}
+        existing_domains = {domain for _, domain in rows if domain}
+        new_companies = []
+
+        reader = read_csv_rows(csv_path)
+        header = next(reader, None) or []
+        domain_col = header.index('domains1') if 'domains1' in header else None
 
-            for row in reader:
-                domain = row.get('domains1', '').strip().lower()
+        for row in reader:
+            if domain_col is None or domain_col >= len(row):
+                continue
+            domain = row[domain_col].strip().lower()
 
-                if not domain:
-                    continue
+            if not domain:
+                continue
 
-                if should_skip_domain(domain):
-                    skipped += 1
-                    continue
+            if should_skip_domain(domain):
+                skipped += 1
+                continue
 
-                company_name = get_company_name(domain)
+            company_name = get_company_name(domain)
 
-                # Check if already exists
-                existing = session.query(Company).filter(
-                    (Company.name == company_name) | (Company.domain == domain)
-                ).first()
+            # Check if already exists
+            if company_name in existing_names or domain in existing_domains:
+                already_exists += 1
+                continue
 
-                if existing:
-                    already_exists += 1
-                    continue
+            # Add company
+            new_companies.append({
+                'name': company_name,
+                'domain': domain,
+                'website': f"https://www.{domain}",
+            })
+            existing_names.add(company_name)
+            existing_domains.add(domain)
+            print(f"  Added: {company_name} ({domain})")
 
-                # Add company
-                company = Company(
-                    name=company_name,
-                    domain=domain,
-                    website=f"https://www.{domain}",
-                )
-                session.add(company)
-                added += 1
-                print(f"  Added: {company_name} ({domain})")
+            # Flush full batches so memory stays bounded on large files
+            if len(new_companies) >= BATCH_SIZE:
+                inserted = db_ops.bulk_create_companies(session, new_companies)
+                session.commit()
+                added += inserted
+                already_exists += len(new_companies) - inserted
+                new_companies = []
 
+        inserted = db_ops.bulk_create_companies(session, new_companies)
         session.commit()
+        added += inserted
+        already_exists += len(new_companies) - inserted
 
         print(f"\nResults:")
         print(f"  Added: {added}")
@@ -10,8 +10,9 @@ Usage:
 import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -47,72 +48,126 @@ def get_companies_from_db(session):
     ]
 
 
-def save_announcement(session, ann_data, auto_draft=True, max_age_days=None):
+def store_drafts(engine, announcement_ids, draft_futures):
     """
-    Save an announcement to the database.
+    Wait for a batch's drafts and save them with one INSERT.
+
+    Uses its own short-lived session. Drafts that failed to generate are
+    logged and skipped.
+    """
+    rows = []
+    for announcement_id, future in zip(announcement_ids, draft_futures):
+        try:
+            rows.append({'announcement_id': announcement_id, 'content': future.result()})
+        except Exception as e:
+            logger.warning("Failed to generate draft post: %s", e)
+
+    session = get_session(engine)
+    try:
+        db_ops.bulk_create_posts(session, rows)
+        logger.debug("Saved %d draft posts", len(rows))
+    except Exception as e:
+        logger.warning("Failed to save draft posts: %s", e)
+    finally:
+        session.close()
+
+
+def save_announcements(session, announcements, auto_draft=True, max_age_days=None,
+                       draft_executor=None):
+    """
+    Save new announcements to the database in bulk.
+
+    Duplicates are checked against recent announcements with one query
+    and new rows are inserted together. Draft posts are generated after
+    the announcements are committed, in worker threads, and saved together
+    once the batch's drafts are done.
 
     Args:
         session: Database session
-        ann_data: Dict with announcement data from aggregator
-        auto_draft: If True, automatically generate draft post
+        announcements: List of announcement dicts from aggregator
+        auto_draft: If True, automatically generate draft posts
         max_age_days: If set, skip announcements older than this
+        draft_executor: Executor to queue draft generation on without
+            waiting for it. If None, drafts are generated before returning.
 
     Returns:
-        True if saved, False if duplicate or invalid
+        Tuple of (saved_count, skipped_count) where skipped covers
+        duplicates and invalid entries
     """
-    # Skip entries without a person name (required field)
-    if not ann_data.get('person_name'):
-        logger.debug(f"Skipping entry without person name: {ann_data.get('source_url')}")
-        return False
-
-    # Skip entries older than max_age_days
-    if max_age_days and ann_data.get('announcement_date'):
-        from datetime import timedelta
-        cutoff = datetime.now().date() - timedelta(days=max_age_days)
-        ann_date = ann_data['announcement_date']
-        if ann_date < cutoff:
-            logger.debug(f"Skipping old announcement ({ann_date}): {ann_data.get('person_name')}")
-            return False
-
-    # Check for duplicates
-    existing = db_ops.check_duplicate(
-        session,
-        company_id=ann_data['company_id'],
-        person_name=ann_data.get('person_name', ''),
-        hours=settings.DEDUP_THRESHOLD_HOURS
-    )
+    cutoff = datetime.now().date() - timedelta(days=max_age_days) if max_age_days else None
+    candidates = []
 
-    if existing:
-        logger.debug(f"Skipping duplicate: {ann_data.get('person_name')} at {ann_data.get('company_name')}")
-        return False
+    for ann_data in announcements:
+        # Skip entries without a person name (required field)
+        if not ann_data.get('person_name'):
+            logger.debug("Skipping entry without person name: %s", ann_data.get('source_url'))
+            continue
 
-    # Create announcement
-    announcement = db_ops.create_announcement(
+        # Skip entries older than max_age_days
+        ann_date = ann_data.get('announcement_date')
+        if cutoff and ann_date and ann_date < cutoff:
+            logger.debug("Skipping old announcement (%s): %s", ann_date, ann_data.get('person_name'))
+            continue
+
+        candidates.append(ann_data)
+
+    # Check for duplicates against recent announcements and this batch
+    recent_names = db_ops.get_recent_person_names(
         session,
-        company_id=ann_data['company_id'],
-        person_name=ann_data.get('person_name'),
-        new_title=ann_data.get('new_title'),
-        announcement_date=ann_data.get('announcement_date'),
-        source_url=ann_data.get('source_url'),
-        source_name=ann_data.get('source_name'),
-        raw_text=ann_data.get('raw_text'),
+        {ann_data['company_id'] for ann_data in candidates},
+        hours=settings.DEDUP_THRESHOLD_HOURS
     )
 
-    logger.info(f"Saved: {ann_data.get('person_name')} - {ann_data.get('new_title')} at {ann_data.get('company_name')}")
+    new_announcements = []
+    for ann_data in candidates:
+        person_name = ann_data['person_name']
+        seen_names = recent_names.setdefault(ann_data['company_id'], [])
+        name_lower = person_name.lower()
 
-    # Auto-generate draft post
-    if auto_draft:
-        try:
-            draft_content = generate_post(ann_data, use_ai=True)
-            db_ops.create_post(session, announcement.id, draft_content)
-            logger.debug(f"Generated draft post for announcement {announcement.id}")
-        except Exception as e:
-            logger.warning(f"Failed to generate draft post: {e}")
-
-    return True
+        if any(name_lower in seen.lower() for seen in seen_names):
+            logger.debug("Skipping duplicate: %s at %s", person_name, ann_data.get('company_name'))
+            continue
 
+        seen_names.append(person_name)
+        new_announcements.append(ann_data)
 
-def run_aggregation(session, companies, days_back=7, company_filter=None):
+    # Create announcements
+    announcement_ids = db_ops.bulk_create_announcements(session, [
+        {
+            'company_id': ann_data['company_id'],
+            'person_name': ann_data['person_name'],
+            'new_title': ann_data.get('new_title'),
+            'announcement_date': ann_data.get('announcement_date'),
+            'source_url': ann_data.get('source_url'),
+            'source_name': ann_data.get('source_name'),
+            'raw_text': ann_data.get('raw_text'),
+        }
+        for ann_data in new_announcements
+    ])
+
+    for ann_data in new_announcements:
+        logger.info(
+            "Saved: %s - %s at %s",
+            ann_data.get('person_name'), ann_data.get('new_title'), ann_data.get('company_name')
+        )
+
+    # Auto-generate draft posts off the aggregation path
+    if auto_draft and new_announcements:
+        engine = session.get_bind()
+        executor = draft_executor or ThreadPoolExecutor(max_workers=settings.CLAUDE_CONCURRENCY)
+        draft_futures = [
+            executor.submit(generate_post, ann_data, use_ai=True)
+            for ann_data in new_announcements
+        ]
+        # Queued after the drafts it waits for, so it cannot starve them
+        executor.submit(store_drafts, engine, announcement_ids, draft_futures)
+        if draft_executor is None:
+            executor.shutdown(wait=True)
+
+    return len(new_announcements), len(announcements) - len(new_announcements)
+
+
+def run_aggregation(session, companies, days_back=7, company_filter=None, draft_executor=None):
     """
     Run the aggregation process.
 
@@ -121,6 +176,7 @@ def run_aggregation(session, companies, days_back=7, company_filter=None):
         companies: List of company dicts
         days_back: How many days of news to fetch
         company_filter: Optional company name to filter
+        draft_executor: Optional executor for background draft generation
 
     Returns:
         Tuple of (new_count, duplicate_count)
@@ -129,24 +185,20 @@ def run_aggregation(session, companies, days_back=7, company_filter=None):
     if company_filter:
         companies = [c for c in companies if company_filter.lower() in c['name'].lower()]
         if not companies:
-            logger.error(f"No company found matching: {company_filter}")
+            logger.error("No company found matching: %s", company_filter)
             return 0, 0
 
-    logger.info(f"Starting aggregation for {len(companies)} companies...")
+    logger.info("Starting aggregation for %d companies...", len(companies))
 
     aggregator = NewsAggregator(companies)
     announcements = aggregator.fetch_all(days_back=days_back)
 
-    new_count = 0
-    dup_count = 0
-
-    for ann in announcements:
-        if save_announcement(session, ann, max_age_days=days_back):
-            new_count += 1
-        else:
-            dup_count += 1
-
-    return new_count, dup_count
+    return save_announcements(
+        session,
+        announcements,
+        max_age_days=days_back,
+        draft_executor=draft_executor
+    )
 
 
 @click.command()
@@ -170,51 +222,55 @@ def main(once, days, company, interval, no_draft):
     engine = get_engine(settings.DATABASE_URL)
     init_db(engine)
 
-    while True:
-        session = get_session(engine)
-        try:
-            # Load companies
-            companies = get_companies_from_db(session)
-
-            if not companies:
-                logger.error("No companies found in database. Run setup_db.py first.")
-                break
-
-            logger.info(f"Loaded {len(companies)} companies from database")
-
-            # Run aggregation
-            start_time = datetime.now()
-            new_count, dup_count = run_aggregation(
-                session,
-                companies,
-                days_back=days,
-                company_filter=company
-            )
-            elapsed = (datetime.now() - start_time).total_seconds()
-
-            print(f"\n{'=' * 50}")
-            print(f"Aggregation completed in {elapsed:.1f}s")
-            print(f"  New announcements: {new_count}")
-            print(f"  Duplicates skipped: {dup_count}")
-            print(f"{'=' * 50}\n")
-
-            if once:
+    # Drafts are generated in the background while aggregation continues;
+    # leaving the block waits for any queued drafts to finish.
+    with ThreadPoolExecutor(max_workers=settings.CLAUDE_CONCURRENCY) as draft_executor:
+        while True:
+            session = get_session(engine)
+            try:
+                # Load companies
+                companies = get_companies_from_db(session)
+
+                if not companies:
+                    logger.error("No companies found in database. Run setup_db.py first.")
+                    break
+
+                logger.info("Loaded %d companies from database", len(companies))
+
+                # Run aggregation
+                start_time = datetime.now()
+                new_count, dup_count = run_aggregation(
+                    session,
+                    companies,
+                    days_back=days,
+                    company_filter=company,
+                    draft_executor=draft_executor
+                )
+                elapsed = (datetime.now() - start_time).total_seconds()
+
+                print(f"\n{'=' * 50}")
+                print(f"Aggregation completed in {elapsed:.1f}s")
+                print(f"  New announcements: {new_count}")
+                print(f"  Duplicates skipped: {dup_count}")
+                print(f"{'=' * 50}\n")
+
+                if once:
+                    break
+
+                logger.info("Sleeping for %d seconds...", interval)
+                time.sleep(interval)
+
+            except KeyboardInterrupt:
+                logger.info("Interrupted by user")
                 break
-
-            logger.info(f"Sleeping for {interval} seconds...")
-            time.sleep(interval)
-
-        except KeyboardInterrupt:
-            logger.info("Interrupted by user")
-            break
-        except Exception as e:
-            logger.error(f"Error during aggregation: {e}")
-            if once:
-                raise
-            logger.info(f"Retrying in {interval} seconds...")
-            time.sleep(interval)
-        finally:
-            session.close()
+            except Exception as e:
+                logger.error("Error during aggregation: %s", e)
+                if once:
+                    raise
+                logger.info("Retrying in %d seconds...", interval)
+                time.sleep(interval)
+            finally:
+                session.close()
 
     print("\nAggregator stopped.")
 
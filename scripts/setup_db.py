@@ -11,39 +11,46 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from sqlalchemy import select
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from config.settings import DATABASE_URL, CONFIG_DIR
-from src.database.models import get_engine, init_db, get_session, Company
+from src.database.models import get_bulk_load_engine, init_db, get_session, Company
+from src.database import operations as db_ops
 
 
 def load_initial_companies(session, companies_file):
     """Load companies from JSON file."""
-    with open(companies_file, 'r') as f:
-        data = json.load(f)
+    with open(companies_file, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
-    added = 0
     skipped = 0
 
+    existing_names = set(session.scalars(select(Company.name)))
+    new_rows = []
+
     for company_data in data.get('companies', []):
         # Check if company already exists
-        existing = session.query(Company).filter(
-            Company.name == company_data['name']
-        ).first()
-
-        if existing:
+        if company_data['name'] in existing_names:
             skipped += 1
             continue
+        existing_names.add(company_data['name'])
 
-        company = Company(
-            name=company_data['name'],
-            domain=company_data.get('domain'),
-            website=company_data.get('website'),
-        )
-        if 'aliases' in company_data:
-            company.set_aliases(company_data['aliases'])
-
-        session.add(company)
-        added += 1
+        new_rows.append({
+            'name': company_data['name'],
+            'domain': company_data.get('domain'),
+            'website': company_data.get('website'),
+            'aliases': company_data.get('aliases'),
+        })
 
+    added = db_ops.bulk_create_companies(session, new_rows)
+    skipped += len(new_rows) - added
     session.commit()
     return added, skipped
 
@@ -56,7 +63,7 @@ def main():
 
     # Create database engine
     print(f"\nDatabase URL: {DATABASE_URL}")
-    engine = get_engine(DATABASE_URL)
+    engine = get_bulk_load_engine(DATABASE_URL)
 
     # Create tables
     print("\nCreating database tables...")
@@ -0,0 +1,108 @@
+"""
+Conditional-GET cache for RSS feeds and scraped pages.
+
+Stores the ETag / Last-Modified validators and parsed articles for each
+URL, so unchanged feeds and pages can be answered with a 304 and skip parsing.
+Entries that have not been checked within max_age seconds are dropped on
+load, so URLs that are no longer polled do not pile up.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """Thread-safe JSON file cache keyed by feed URL."""
+
+    def __init__(self, path: Path, max_age: Optional[float] = None):
+        self.path = Path(path)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable feed cache %s: %s", self.path, e)
+            return {}
+
+        if self.max_age is None:
+            return entries
+
+        # Entries written before 'checked' was recorded count as fresh
+        now = time.time()
+        fresh = {
+            url: entry for url, entry in entries.items()
+            if now - entry.setdefault('checked', now) < self.max_age
+        }
+        if len(fresh) != len(entries):
+            self._dirty = True
+        return fresh
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Get the cached entry for a URL: etag, modified and articles."""
+        with self._lock:
+            return self._entries.get(url)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a URL."""
+        entry = self.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('modified'):
+            headers['If-Modified-Since'] = entry['modified']
+        return headers
+
+    def set(self, url: str, etag: Optional[str], modified: Optional[str],
+            articles: List[Dict]):
+        """Store validators and articles for a URL, if the server sent any validators."""
+        with self._lock:
+            if etag or modified:
+                self._entries[url] = {
+                    'etag': etag,
+                    'modified': modified,
+                    'articles': articles,
+                    'checked': time.time(),
+                }
+                self._dirty = True
+            elif self._entries.pop(url, None) is not None:
+                self._dirty = True
+
+    def touch(self, url: str):
+        """Mark a URL's entry as still current, after a 304."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                entry['checked'] = time.time()
+                self._dirty = True
+
+    def save(self):
+        """Write the cache to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(self.path.name + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning("Could not save feed cache %s: %s", self.path, e)
@@ -2,13 +2,23 @@
 News fetcher for People on the Move.
 Fetches news from RSS feeds and News APIs, then parses for executive moves.
 """
+import re
 import time
 import logging
-from typing import List, Dict, Optional, Generator
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from typing import List, Dict, Optional, Generator, Tuple
 from datetime import datetime, timedelta
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 
 import feedparser
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import settings
 from .rss_sources import (
@@ -19,17 +29,395 @@ from .rss_sources import (
     EXECUTIVE_MOVE_QUERIES
 )
 
+from .feed_cache import FeedCache
+from .parsers import ArticleParser, CompanyMatcher, parse_article_fields
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     HAS_BS4 = True
 except ImportError:
     HAS_BS4 = False
     logger.warning("BeautifulSoup not installed. PR Newswire scraping disabled. Run: pip install beautifulsoup4")
-from .parsers import ArticleParser, find_company_in_text
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# PR Newswire often prefixes titles with the release date:
+# "Feb 24, 2026, 16:30 ETActual Title..."
+PRN_DATE_RE = re.compile(
+    r'^((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}(?:,\s+\d{1,2}:\d{2}\s*(?:ET|PT|CT|MT))?)\s*',
+    re.IGNORECASE
+)
+# Month abbreviation anywhere in the text (also matches "January", etc.)
+MONTH_RE = re.compile(r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec')
+
+# NewsAPI query shape: one request can cover several companies OR'ed
+# together, within NewsAPI's limit on the length of q
+NEWSAPI_QUERY_SUFFIX = ' AND (appointed OR promoted OR named OR hires OR VP OR director OR executive)'
+NEWSAPI_MAX_QUERY_LENGTH = 500
+NEWSAPI_MAX_BATCH = 20
+
+
+def build_newsapi_query(company_names: List[str]) -> str:
+    """Build a NewsAPI q parameter matching executive moves at any of the companies."""
+    names = ' OR '.join(f'"{name}"' for name in company_names)
+    if len(company_names) > 1:
+        names = f'({names})'
+    return names + NEWSAPI_QUERY_SUFFIX
+
+
+# Seconds a fetched feed is reused within a run before fetching it again
+RECENT_FEED_TTL = 300
+
+# Query parameters that only track the click, not the article
+TRACKING_PARAMS = frozenset(['fbclid', 'gclid'])
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL for deduplication.
+
+    Lowercases the host, drops utm_*/fbclid/gclid tracking parameters and
+    strips a trailing slash from the path.
+    """
+    if not url:
+        return url
+
+    parts = urlsplit(url)
+    query = parts.query
+    if query:
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if not key.startswith('utm_') and key not in TRACKING_PARAMS
+        ])
+    return urlunsplit((
+        parts.scheme,
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        query,
+        parts.fragment
+    ))
+
+
+# Prefer the C-based lxml parser; html.parser is several times slower
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+def parse_prnewswire_page(html: bytes, company_name: str, max_items: int = 25) -> List[Dict]:
+    """
+    Extract press release listings from a PR Newswire company page.
+
+    Top-level so it can run in the parse process pool.
+    """
+    # Pass raw bytes so the parser detects the encoding itself.
+    # Only links and the containers searched around them are kept;
+    # <head>, scripts and other top-level markup are never built.
+    soup = BeautifulSoup(
+        html,
+        HTML_PARSER,
+        parse_only=SoupStrainer(['a', 'article', 'div', 'li'])
+    )
+    articles = []
+
+    # Find news release cards - PR Newswire uses various card layouts
+    # Look for common patterns: article cards, news items, release links
+    news_items = soup.find_all('a', class_=lambda x: x and ('newsreleaseconsolidatelink' in x.lower() or 'card' in x.lower()))
+
+    # Also try finding by href pattern for news releases
+    if not news_items:
+        news_items = soup.find_all('a', href=lambda x: x and '/news-releases/' in x)
+
+    seen_urls = set()
+    for item in news_items:
+        if len(articles) >= max_items:
+            break
+
+        href = item.get('href', '')
+        if not href or '/news-releases/' not in href:
+            continue
+
+        # Build full URL
+        if href.startswith('/'):
+            full_url = f"https://www.prnewswire.com{href}"
+        else:
+            full_url = href
+
+        # Skip duplicates
+        if full_url in seen_urls:
+            continue
+        seen_urls.add(full_url)
+
+        # Extract title from link text or nearby heading
+        # Use separator to avoid word concatenation
+        title = item.get_text(separator=' ', strip=True)
+        parent = item.find_parent(['article', 'div', 'li'])
+
+        if not title or len(title) < 10:
+            # Try to find title in parent or nearby elements
+            if parent:
+                h_tag = parent.find(['h1', 'h2', 'h3', 'h4'])
+                if h_tag:
+                    title = h_tag.get_text(separator=' ', strip=True)
+
+        if not title or len(title) < 10:
+            continue
+
+        # Try to extract date from nearby elements or from title prefix
+        published = ''
+
+        # PR Newswire often has date embedded at start of title
+        date_match = PRN_DATE_RE.match(title)
+        if date_match:
+            published = date_match.group(1).strip()
+            # Remove date prefix from title
+            title = title[date_match.end():].strip()
+
+        if not published and parent:
+            # Look for time/date elements
+            time_el = parent.find(['time', 'span'], class_=lambda x: x and ('date' in x.lower() or 'time' in x.lower()))
+            if time_el:
+                published = time_el.get('datetime', '') or time_el.get_text(strip=True)
+            else:
+                # Look for date patterns in text
+                for span in parent.find_all('span'):
+                    text = span.get_text(strip=True)
+                    # Simple date pattern check (e.g., "Feb 24, 2026")
+                    if MONTH_RE.search(text):
+                        published = text
+                        break
+
+        # Extract summary/description if available
+        content = ''
+        if parent:
+            p_tag = parent.find('p')
+            if p_tag:
+                content = p_tag.get_text(strip=True)
+
+        articles.append({
+            'title': title,
+            'content': content or title,  # Use title as fallback content
+            'link': full_url,
+            'published': published,
+            'source_name': f'PR Newswire - {company_name}',
+        })
+
+    return articles
+
+
+_RSS_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+# RSS 2.0 item elements read by parse_rss_fast, and namespaced local names
+# feedparser would fold into the same article fields
+RSS_ITEM_FIELDS = ('title', 'description', 'link', 'pubDate')
+RSS_ALIASED_NAMES = frozenset((
+    'title', 'link', 'description', 'summary', 'pubDate', 'published',
+    'updated', 'date', 'subtitle', 'content', 'encoded',
+))
+
+
+def _charset_key(name: str) -> str:
+    return name.lower().replace('-', '').replace('_', '')
+
+
+def parse_rss_fast(content: bytes, response_headers: Dict[str, str],
+                   max_items: int = 50) -> Optional[List[Dict]]:
+    """
+    Parse a plain RSS 2.0 feed with lxml.
+
+    Returns None for anything feedparser should handle instead: malformed
+    XML, Atom/RDF, a charset header that disagrees with the document, or
+    items missing one of title/description/link/pubDate.
+    """
+    try:
+        root = etree.fromstring(content, _RSS_XML_PARSER)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+    if root.tag != 'rss':
+        return None
+    channel = root.find('channel')
+    if channel is None:
+        return None
+
+    content_type = response_headers.get('content-type', '').lower()
+    if 'charset=' in content_type:
+        charset = content_type.split('charset=', 1)[1].split(';')[0].strip(' "\'')
+        declared = root.getroottree().docinfo.encoding or 'utf-8'
+        if _charset_key(charset) != _charset_key(declared):
+            return None
+
+    title_el = channel.find('title')
+    source_name = (title_el.text or '').strip() if title_el is not None else 'RSS Feed'
+
+    articles = []
+    for item in channel.iterfind('item'):
+        if len(articles) >= max_items:
+            break
+
+        fields = {}
+        for child in item:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue
+            if tag[0] == '{' and tag.rpartition('}')[2] in RSS_ALIASED_NAMES:
+                return None
+            if tag in RSS_ITEM_FIELDS:
+                # Repeated or nested fields get feedparser's merging rules
+                if tag in fields or len(child):
+                    return None
+                fields[tag] = (child.text or '').strip()
+
+        if len(fields) != len(RSS_ITEM_FIELDS):
+            return None
+        # feedparser unescapes entities in links a second time
+        link = fields['link']
+        if '&' in link and ';' in link:
+            return None
+
+        articles.append({
+            'title': fields['title'],
+            'content': fields['description'],
+            'link': link,
+            'published': fields['pubDate'],
+            'source_name': source_name,
+        })
+
+    return articles
+
+
+def parse_feed(content: bytes, response_headers: Dict[str, str],
+               max_items: int = 50) -> Optional[List[Dict]]:
+    """
+    Parse RSS/Atom content into article dicts.
+
+    Top-level so it can run in the parse process pool. Returns None if the
+    feed could not be parsed at all.
+    """
+    articles = parse_rss_fast(content, response_headers, max_items)
+    if articles is not None:
+        return articles
+
+    # Summaries go through ArticleParser.clean_html, so feedparser's own
+    # HTML sanitizing and relative-URI rewriting would only be thrown away
+    feed = feedparser.parse(
+        content,
+        response_headers=response_headers,
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+
+    if feed.bozo and not feed.entries:
+        return None
+
+    # Read entries as plain dicts: FeedParserDict.get goes through key
+    # aliasing (and a deprecation warning for 'updated') on every call.
+    # 'description' is feedparser's alias for summary, then subtitle.
+    source_name = feed.feed.get('title', 'RSS Feed')
+    get = dict.get
+
+    articles = []
+    for entry in feed.entries[:max_items]:
+        article = {
+            'title': get(entry, 'title', ''),
+            'content': get(entry, 'summary', get(entry, 'subtitle', '')),
+            'link': get(entry, 'link', ''),
+            'published': get(entry, 'published', get(entry, 'updated', '')),
+            'source_name': source_name,
+        }
+        articles.append(article)
+
+    return articles
+
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+# Batches smaller than this are parsed inline rather than shipped to the pool
+PARALLEL_PARSE_MIN_ITEMS = 32
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool for CPU-bound parsing.
+
+    Parsing holds the GIL, so large batches are spread over PARSE_WORKERS
+    processes. Returns None with fewer than two workers configured,
+    meaning parse in the calling thread.
+    """
+    global _parse_pool
+
+    if settings.PARSE_WORKERS < 2:
+        return None
+
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # spawn, not fork: the pool starts while fetch threads are running
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=settings.PARSE_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+
+    return _parse_pool
+
+
+def map_parser(func, items: List, chunksize: int = 16) -> List:
+    """
+    Map a CPU-bound parse function over items in the shared process pool.
+
+    Single documents are parsed where they are fetched instead; shipping one
+    document to another process costs more than parsing it.
+    """
+    pool = get_parse_pool() if len(items) >= PARALLEL_PARSE_MIN_ITEMS else None
+    if pool is None:
+        return [func(item) for item in items]
+    return list(pool.map(func, items, chunksize=chunksize))
+
+
+class HostRateLimiter:
+    """
+    Per-host request spacing.
+
+    Requests to one host start at least min_interval seconds apart;
+    requests to different hosts never wait on each other. Each request
+    reserves its start time under a short lock, so a slow response does not
+    hold up the host's next request.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        # netloc -> earliest monotonic time the next request may start
+        self._next_start = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str):
+        """Wait for the next free start time on url's host, then run the request."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+
+        if start > now:
+            time.sleep(start - now)
+        yield
+
+
+def merge_google_news(futures: List[Future]) -> List[Dict]:
+    """Collect Google News query results, deduplicated by canonical URL."""
+    seen_urls = set()
+    unique_articles = []
+    for future in futures:
+        for article in future.result():
+            url = canonicalize_url(article['link'])
+            if url not in seen_urls:
+                seen_urls.add(url)
+                unique_articles.append(article)
+    return unique_articles
 
 
 class NewsFetcher:
@@ -39,39 +427,107 @@ class NewsFetcher:
         self.parser = ArticleParser()
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; PeopleOnTheMove/1.0)'
+            'User-Agent': 'Mozilla/5.0 (compatible; PeopleOnTheMove/1.0)',
+            'Accept-Encoding': 'gzip, deflate',
         })
+        # Keep connections to every feed host alive across the concurrent
+        # fetches, and retry transient server errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=settings.FETCH_MAX_WORKERS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # One request at a time per host, spaced out, so concurrent fetches stay polite
+        self.rate_limiter = HostRateLimiter(settings.HOST_MIN_INTERVAL)
+        # ETag/Last-Modified validators and articles from earlier runs
+        self.feed_cache = FeedCache(
+            settings.FEED_CACHE_PATH,
+            max_age=settings.FEED_CACHE_MAX_AGE_DAYS * 86400
+        )
+        # (feed_url, max_items) -> (fetched at, articles) for this process
+        self._recent_feeds = {}
+        self._recent_feeds_lock = threading.Lock()
+        # Every individual download runs on this one bounded pool. Only
+        # leaf fetches are submitted to it, never work that waits on it.
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.FETCH_MAX_WORKERS,
+            thread_name_prefix='fetch'
+        )
+
+    def host_slot(self, url: str):
+        """Context manager holding the rate-limited request slot for url's host."""
+        return self.rate_limiter.slot(url)
 
     def fetch_rss_feed(self, feed_url: str, max_items: int = 50) -> List[Dict]:
         """
         Fetch and parse an RSS feed.
 
+        A feed fetched in the last RECENT_FEED_TTL seconds is served from
+        memory, so overlapping URLs within one run are fetched once.
+
         Returns list of article dicts with:
         - title, content, link, published, source_name
         """
-        try:
-            feed = feedparser.parse(feed_url)
+        key = (feed_url, max_items)
+        now = time.monotonic()
+        with self._recent_feeds_lock:
+            recent = self._recent_feeds.get(key)
+        if recent and now - recent[0] < RECENT_FEED_TTL:
+            return [dict(article) for article in recent[1]]
+
+        articles = self.download_rss_feed(feed_url, max_items)
+        if articles:
+            with self._recent_feeds_lock:
+                self._recent_feeds[key] = (now, [dict(article) for article in articles])
+        return articles
 
-            if feed.bozo and not feed.entries:
-                logger.warning(f"Failed to parse RSS feed: {feed_url}")
+    def download_rss_feed(self, feed_url: str, max_items: int = 50) -> List[Dict]:
+        """Download and parse an RSS feed, using a conditional request when possible."""
+        try:
+            cached = self.feed_cache.get(feed_url)
+
+            # Download through the shared session (connection reuse and a
+            # timeout). The request is conditional, so unchanged feeds
+            # return a 304.
+            with self.host_slot(feed_url), \
+                    self.session.get(
+                        feed_url,
+                        headers=self.feed_cache.conditional_headers(feed_url),
+                        timeout=15
+                    ) as response:
+                if response.status_code == 304 and cached:
+                    logger.info("Feed unchanged since last fetch: %s", feed_url)
+                    self.feed_cache.touch(feed_url)
+                    return [dict(article) for article in cached['articles'][:max_items]]
+
+                response.raise_for_status()
+                content = response.content
+
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            articles = parse_feed(content, response_headers, max_items)
+
+            if articles is None:
+                logger.warning("Failed to parse RSS feed: %s", feed_url)
                 return []
 
-            articles = []
-            for entry in feed.entries[:max_items]:
-                article = {
-                    'title': entry.get('title', ''),
-                    'content': entry.get('summary', entry.get('description', '')),
-                    'link': entry.get('link', ''),
-                    'published': entry.get('published', entry.get('updated', '')),
-                    'source_name': feed.feed.get('title', 'RSS Feed'),
-                }
-                articles.append(article)
-
-            logger.info(f"Fetched {len(articles)} articles from {feed_url}")
+            self.feed_cache.set(
+                feed_url,
+                etag=response.headers.get('ETag'),
+                modified=response.headers.get('Last-Modified'),
+                articles=[dict(article) for article in articles]
+            )
+
+            logger.info("Fetched %d articles from %s", len(articles), feed_url)
             return articles
 
         except Exception as e:
-            logger.error(f"Error fetching RSS feed {feed_url}: {e}")
+            logger.error("Error fetching RSS feed %s: %s", feed_url, e)
             return []
 
     def fetch_google_news(self, company_name: str, days_back: int = 7) -> List[Dict]:
@@ -85,25 +541,15 @@ class NewsFetcher:
         Returns:
             List of article dicts
         """
-        all_articles = []
-
-        for query_template in EXECUTIVE_MOVE_QUERIES[:6]:  # Use more queries for better coverage
-            url = build_google_news_url(company_name, query_template)
-            articles = self.fetch_rss_feed(url, max_items=20)
-            all_articles.extend(articles)
-
-            # Be nice to Google
-            time.sleep(0.5)
-
-        # Deduplicate by URL
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            if article['link'] not in seen_urls:
-                seen_urls.add(article['link'])
-                unique_articles.append(article)
+        return merge_google_news(self.submit_google_news(company_name, days_back))
 
-        return unique_articles
+    def submit_google_news(self, company_name: str, days_back: int = 7) -> List[Future]:
+        """Queue one Google News RSS download per query; see merge_google_news."""
+        urls = [
+            build_google_news_url(company_name, query_template)
+            for query_template in EXECUTIVE_MOVE_QUERIES[:6]  # Use more queries for better coverage
+        ]
+        return [self.executor.submit(self.fetch_rss_feed, url, 20) for url in urls]
 
     def fetch_newsapi(self, company_name: str, days_back: int = 7) -> List[Dict]:
         """
@@ -111,6 +557,16 @@ class NewsFetcher:
 
         Requires NEWSAPI_KEY in settings.
         """
+        return self.fetch_newsapi_batch([company_name], days_back=days_back)
+
+    def fetch_newsapi_batch(self, company_names: List[str], days_back: int = 7) -> List[Dict]:
+        """
+        Fetch news about several companies from NewsAPI.org in one request.
+
+        Requires NEWSAPI_KEY in settings.
+        """
+        if isinstance(company_names, str):
+            raise TypeError("fetch_newsapi_batch expects a list of company names")
         if not settings.NEWSAPI_KEY:
             logger.debug("NewsAPI key not configured, skipping")
             return []
@@ -120,7 +576,7 @@ class NewsFetcher:
 
             url = "https://newsapi.org/v2/everything"
             params = {
-                'q': f'"{company_name}" AND (appointed OR promoted OR named OR hires OR VP OR director OR executive)',
+                'q': build_newsapi_query(company_names),
                 'from': from_date,
                 'language': 'en',
                 'sortBy': 'publishedAt',
@@ -128,7 +584,8 @@ class NewsFetcher:
                 'apiKey': settings.NEWSAPI_KEY
             }
 
-            response = self.session.get(url, params=params, timeout=30)
+            with self.host_slot(url):
+                response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -142,11 +599,12 @@ class NewsFetcher:
                     'source_name': item.get('source', {}).get('name', 'NewsAPI'),
                 })
 
-            logger.info(f"Fetched {len(articles)} articles from NewsAPI for {company_name}")
+            logger.info("Fetched %d articles from NewsAPI for %s",
+                        len(articles), ', '.join(company_names))
             return articles
 
         except Exception as e:
-            logger.error(f"Error fetching from NewsAPI for {company_name}: {e}")
+            logger.error("Error fetching from NewsAPI for %s: %s", ', '.join(company_names), e)
             return []
 
     def fetch_company_newsroom(self, company_name: str) -> List[Dict]:
@@ -182,127 +640,61 @@ class NewsFetcher:
 
         page_url = get_prnewswire_company_url(company_name)
         if not page_url:
-            logger.debug(f"No PR Newswire page configured for {company_name}")
+            logger.debug("No PR Newswire page configured for %s", company_name)
             return []
 
         try:
-            response = self.session.get(page_url, timeout=30)
-            response.raise_for_status()
+            cached = self.feed_cache.get(page_url)
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            articles = []
+            with self.host_slot(page_url):
+                response = self.session.get(
+                    page_url,
+                    headers=self.feed_cache.conditional_headers(page_url),
+                    timeout=30
+                )
 
-            # Find news release cards - PR Newswire uses various card layouts
-            # Look for common patterns: article cards, news items, release links
-            news_items = soup.find_all('a', class_=lambda x: x and ('newsreleaseconsolidatelink' in x.lower() or 'card' in x.lower()))
-
-            # Also try finding by href pattern for news releases
-            if not news_items:
-                news_items = soup.find_all('a', href=lambda x: x and '/news-releases/' in x)
-
-            seen_urls = set()
-            for item in news_items:
-                if len(articles) >= max_items:
-                    break
-
-                href = item.get('href', '')
-                if not href or '/news-releases/' not in href:
-                    continue
-
-                # Build full URL
-                if href.startswith('/'):
-                    full_url = f"https://www.prnewswire.com{href}"
-                else:
-                    full_url = href
-
-                # Skip duplicates
-                if full_url in seen_urls:
-                    continue
-                seen_urls.add(full_url)
-
-                # Extract title from link text or nearby heading
-                # Use separator to avoid word concatenation
-                title = item.get_text(separator=' ', strip=True)
-
-                if not title or len(title) < 10:
-                    # Try to find title in parent or nearby elements
-                    parent = item.find_parent(['article', 'div', 'li'])
-                    if parent:
-                        h_tag = parent.find(['h1', 'h2', 'h3', 'h4'])
-                        if h_tag:
-                            title = h_tag.get_text(separator=' ', strip=True)
-
-                if not title or len(title) < 10:
-                    continue
-
-                # Try to extract date from nearby elements or from title prefix
-                published = ''
-                parent = item.find_parent(['article', 'div', 'li'])
-
-                # PR Newswire often has date embedded at start of title: "Feb 24, 2026, 16:30 ETActual Title..."
-                import re
-                date_pattern = r'^((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}(?:,\s+\d{1,2}:\d{2}\s*(?:ET|PT|CT|MT))?)\s*'
-                date_match = re.match(date_pattern, title, re.IGNORECASE)
-                if date_match:
-                    published = date_match.group(1).strip()
-                    # Remove date prefix from title
-                    title = title[date_match.end():].strip()
-
-                if not published and parent:
-                    # Look for time/date elements
-                    time_el = parent.find(['time', 'span'], class_=lambda x: x and ('date' in x.lower() or 'time' in x.lower()))
-                    if time_el:
-                        published = time_el.get('datetime', '') or time_el.get_text(strip=True)
-                    else:
-                        # Look for date patterns in text
-                        for span in parent.find_all('span'):
-                            text = span.get_text(strip=True)
-                            # Simple date pattern check (e.g., "Feb 24, 2026")
-                            if any(month in text for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                                                                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
-                                published = text
-                                break
-
-                # Extract summary/description if available
-                content = ''
-                if parent:
-                    p_tag = parent.find('p')
-                    if p_tag:
-                        content = p_tag.get_text(strip=True)
+            if response.status_code == 304 and cached:
+                logger.info("PR Newswire page unchanged for %s", company_name)
+                self.feed_cache.touch(page_url)
+                return [dict(article) for article in cached['articles'][:max_items]]
 
-                articles.append({
-                    'title': title,
-                    'content': content or title,  # Use title as fallback content
-                    'link': full_url,
-                    'published': published,
-                    'source_name': f'PR Newswire - {company_name}',
-                })
+            response.raise_for_status()
+
+            articles = parse_prnewswire_page(response.content, company_name, max_items)
+            self.feed_cache.set(
+                page_url,
+                etag=response.headers.get('ETag'),
+                modified=response.headers.get('Last-Modified'),
+                articles=[dict(article) for article in articles]
+            )
 
-            logger.info(f"Scraped {len(articles)} releases from PR Newswire for {company_name}")
+            logger.info("Scraped %d releases from PR Newswire for %s", len(articles), company_name)
             return articles
 
         except Exception as e:
-            logger.error(f"Error scraping PR Newswire for {company_name}: {e}")
+            logger.error("Error scraping PR Newswire for %s: %s", company_name, e)
             return []
 
-    def fetch_industry_feeds(self) -> List[Dict]:
-        """Fetch all industry RSS feeds."""
-        all_articles = []
-
-        for feed in get_all_rss_feeds():
-            articles = self.fetch_rss_feed(
-                feed['url'],
-                max_items=settings.MAX_ARTICLES_PER_SOURCE
-            )
-            # Add source name from config
-            for article in articles:
-                article['source_name'] = feed['name']
-            all_articles.extend(articles)
+    def fetch_industry_feed(self, feed: Dict) -> List[Dict]:
+        """Fetch one configured industry feed, tagged with its configured name."""
+        articles = self.fetch_rss_feed(
+            feed['url'],
+            max_items=settings.MAX_ARTICLES_PER_SOURCE
+        )
+        # Add source name from config
+        for article in articles:
+            article['source_name'] = feed['name']
+        return articles
 
-            # Be respectful to servers
-            time.sleep(0.3)
+    def fetch_industry_feeds(self) -> List[Dict]:
+        """Fetch all industry RSS feeds concurrently."""
+        return list(chain.from_iterable(
+            future.result() for future in self.submit_industry_feeds()
+        ))
 
-        return all_articles
+    def submit_industry_feeds(self) -> List[Future]:
+        """Queue a download for every industry RSS feed."""
+        return [self.executor.submit(self.fetch_industry_feed, feed) for feed in get_all_rss_feeds()]
 
 
 class NewsAggregator:
@@ -318,12 +710,14 @@ class NewsAggregator:
             companies: List of company dicts with 'id', 'name', 'aliases'
         """
         self.companies = companies
+        self.company_matcher = CompanyMatcher(companies)
         self.fetcher = NewsFetcher()
         self.parser = ArticleParser()
 
     def process_articles(self, articles: List[Dict],
                          target_company: Dict = None,
-                         max_age_days: int = None) -> Generator[Dict, None, None]:
+                         max_age_days: int = None,
+                         matcher: CompanyMatcher = None) -> Generator[Dict, None, None]:
         """
         Process articles and yield structured announcement data.
 
@@ -331,90 +725,132 @@ class NewsAggregator:
             articles: List of raw article dicts
             target_company: If provided, only match this company
             max_age_days: If provided, filter out articles older than this
+            matcher: Companies to match when no target_company is given
+                (defaults to all tracked companies)
 
         Yields:
             Dict with announcement data ready for database
         """
+        if target_company:
+            # Only keep articles that mention the target company
+            matcher = CompanyMatcher([target_company])
+        else:
+            # Search for any tracked company
+            matcher = matcher or self.company_matcher
+
+        # Find company mentioned in each article first: one automaton pass
+        # is much cheaper than parsing an article that gets dropped
+        companies = []
+        fields = []
         for article in articles:
-            # Parse article for executive move
-            parsed = self.parser.parse_article(
-                title=article.get('title', ''),
-                content=article.get('content', ''),
-                published_date=article.get('published'),
-                source_url=article.get('link'),
-                source_name=article.get('source_name'),
-                max_age_days=max_age_days
-            )
-
+            combined_text = f"{article.get('title', '')} {article.get('content', '')}"
+            company = matcher.find(combined_text)
+            if company:
+                companies.append(company)
+                fields.append((
+                    article.get('title', ''),
+                    article.get('content', ''),
+                    article.get('published'),
+                    article.get('link'),
+                    article.get('source_name'),
+                    max_age_days,
+                ))
+
+        # Parse articles for executive moves, across processes for big batches
+        for company, parsed in zip(companies, map_parser(parse_article_fields, fields)):
             if not parsed:
                 continue
 
-            # Find company mentioned in article
-            combined_text = f"{article.get('title', '')} {article.get('content', '')}"
-
-            if target_company:
-                # Verify target company is mentioned
-                if not find_company_in_text(combined_text, [target_company]):
-                    continue
-                company = target_company
-            else:
-                # Search for any tracked company
-                company = find_company_in_text(combined_text, self.companies)
-                if not company:
-                    continue
-
             # Add company info to parsed data
             parsed['company_id'] = company.get('id')
             parsed['company_name'] = company.get('name')
 
             yield parsed
 
-    def fetch_for_company(self, company: Dict, days_back: int = 7) -> List[Dict]:
+    def fetch_for_company(self, company: Dict, days_back: int = 7,
+                          include_newsapi: bool = True) -> List[Dict]:
         """
         Fetch all news for a specific company.
 
         Args:
             company: Company dict with 'id', 'name', 'aliases'
             days_back: How many days of news to fetch
+            include_newsapi: If False, skip NewsAPI (fetch_all queries it
+                in batches instead)
 
         Returns:
             List of structured announcement dicts
         """
-        logger.info(f"Fetching news for {company['name']}...")
-
-        all_articles = []
+        return self.collect_company(company, self.submit_company(company, days_back, include_newsapi))
 
-        # Fetch from Google News
-        google_articles = self.fetcher.fetch_google_news(
-            company['name'],
-            days_back=days_back
-        )
-        all_articles.extend(google_articles)
+    def submit_company(self, company: Dict, days_back: int = 7,
+                       include_newsapi: bool = True) -> Tuple[List[Future], List[Future]]:
+        """
+        Queue every download for a company on the fetcher's pool.
 
-        # Fetch from NewsAPI if configured
-        newsapi_articles = self.fetcher.fetch_newsapi(
-            company['name'],
-            days_back=days_back
+        Returns:
+            (Google News query futures, futures for the other sources)
+        """
+        logger.info("Fetching news for %s...", company['name'])
+        fetcher = self.fetcher
+
+        # Query all sources at once; they hit different hosts
+        google = fetcher.submit_google_news(company['name'], days_back=days_back)
+        sources = []
+        # NewsAPI, if configured
+        if include_newsapi:
+            sources.append(fetcher.executor.submit(fetcher.fetch_newsapi, company['name'], days_back))
+        # Company newsroom
+        sources.append(fetcher.executor.submit(fetcher.fetch_company_newsroom, company['name']))
+        # PR Newswire company page (scraped)
+        sources.append(fetcher.executor.submit(fetcher.fetch_prnewswire_company, company['name']))
+        return google, sources
+
+    def collect_company(self, company: Dict,
+                        pending: Tuple[List[Future], List[Future]]) -> List[Dict]:
+        """Process the downloads queued by submit_company as they complete."""
+        google, sources = pending
+        # (filter by date handled in run script)
+        all_articles = chain(
+            merge_google_news(google),
+            chain.from_iterable(future.result() for future in sources)
         )
-        all_articles.extend(newsapi_articles)
-
-        # Fetch from company newsroom
-        newsroom_articles = self.fetcher.fetch_company_newsroom(company['name'])
-        all_articles.extend(newsroom_articles)
-
-        # Fetch from PR Newswire company page (scraped)
-        prnewswire_articles = self.fetcher.fetch_prnewswire_company(company['name'])
-        all_articles.extend(prnewswire_articles)
-
-        # Process all articles (filter by date handled in run script)
         announcements = list(self.process_articles(
             all_articles,
             target_company=company
         ))
 
-        logger.info(f"Found {len(announcements)} executive moves for {company['name']}")
+        logger.info("Found %d executive moves for %s", len(announcements), company['name'])
         return announcements
 
+    def newsapi_batches(self) -> List[List[Dict]]:
+        """Group companies so each group fits in one NewsAPI query."""
+        batches = []
+        batch = []
+        for company in self.companies:
+            candidate = batch + [company]
+            query = build_newsapi_query([c['name'] for c in candidate])
+            if batch and (len(candidate) > NEWSAPI_MAX_BATCH or len(query) > NEWSAPI_MAX_QUERY_LENGTH):
+                batches.append(batch)
+                batch = [company]
+            else:
+                batch = candidate
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def fetch_newsapi_batch(self, companies: List[Dict], days_back: int = 7) -> List[Dict]:
+        """Fetch NewsAPI news for a group of companies with a single request."""
+        articles = self.fetcher.fetch_newsapi_batch(
+            [company['name'] for company in companies],
+            days_back=days_back
+        )
+        return self.collect_newsapi_batch(companies, articles)
+
+    def collect_newsapi_batch(self, companies: List[Dict], articles: List[Dict]) -> List[Dict]:
+        """Attribute each article to the group company it mentions."""
+        return list(self.process_articles(articles, matcher=CompanyMatcher(companies)))
+
     def fetch_all(self, days_back: int = 7) -> List[Dict]:
         """
         Fetch news for all companies.
@@ -425,33 +861,44 @@ class NewsAggregator:
         Returns:
             List of all structured announcement dicts
         """
-        all_announcements = []
-
-        # First, fetch industry feeds (applies to all companies)
+        # Canonical source_url -> first announcement seen for it; items
+        # without a URL are keyed by id() so every one of them is kept
+        unique = {}
+
+        def add_unique(announcements):
+            """Deduplicate by canonical source_url as results come in."""
+            for ann in announcements:
+                unique.setdefault(canonicalize_url(ann.get('source_url', '')) or id(ann), ann)
+
+        # Industry feeds (applies to all companies) download alongside the
+        # company-specific news, with NewsAPI queried for groups of
+        # companies rather than one request per company. Every download
+        # is queued on the fetcher's one bounded pool up front.
         logger.info("Fetching industry feeds...")
-        industry_articles = self.fetcher.fetch_industry_feeds()
-        industry_announcements = list(self.process_articles(industry_articles))
-        all_announcements.extend(industry_announcements)
+        fetcher = self.fetcher
+        industry = fetcher.submit_industry_feeds()
+        pending = [
+            (company, self.submit_company(company, days_back, include_newsapi=False))
+            for company in self.companies
+        ]
+        newsapi_pending = [
+            (batch, fetcher.executor.submit(
+                fetcher.fetch_newsapi_batch, [company['name'] for company in batch], days_back
+            ))
+            for batch in (self.newsapi_batches() if settings.NEWSAPI_KEY else [])
+        ]
+
+        # Industry matches still go first, so they win duplicate URLs
+        add_unique(self.process_articles(
+            chain.from_iterable(future.result() for future in industry)
+        ))
+        for company, company_pending in pending:
+            add_unique(self.collect_company(company, company_pending))
+        for batch, future in newsapi_pending:
+            add_unique(self.collect_newsapi_batch(batch, future.result()))
 
-        # Then fetch company-specific news
-        for company in self.companies:
-            company_announcements = self.fetch_for_company(company, days_back)
-            all_announcements.extend(company_announcements)
-
-            # Be respectful to APIs
-            time.sleep(1)
-
-        # Deduplicate by source_url
-        seen_urls = set()
-        unique = []
-        for ann in all_announcements:
-            url = ann.get('source_url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique.append(ann)
-            elif not url:
-                # Keep items without URL but may have duplicates
-                unique.append(ann)
+        # Keep feed validators for the next run
+        self.fetcher.feed_cache.save()
 
-        logger.info(f"Total unique announcements found: {len(unique)}")
-        return unique
+        logger.info("Total unique announcements found: %d", len(unique))
+        return list(unique.values())
@@ -2,16 +2,25 @@
 Parsers for extracting structured data from news articles.
 """
 import re
-from typing import Dict, List, Optional, Tuple, Set
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple, Set
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 from dateutil import parser as date_parser
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml.etree import ParserError
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 from .rss_sources import EXECUTIVE_TITLES, EXECUTIVE_KEYWORDS
 
 # Blacklist of known false positives for person names
 # These are publication names, company names, and common phrases that get incorrectly extracted
-FALSE_POSITIVE_NAMES: Set[str] = {
+FALSE_POSITIVE_NAMES: FrozenSet[str] = frozenset({
     # News publications
     'supermarket news', 'progressive grocer', 'grocery dive', 'food dive',
     'meat poultry', 'meat + poultry', 'reuters', 'associated press', 'ap news',
@@ -41,10 +50,10 @@ FALSE_POSITIVE_NAMES: Set[str] = {
     'new ceo', 'new president', 'new cfo', 'new coo', 'next ceo',
     'its next ceo', 'new hire', 'top executive', 'senior executive',
     'board member', 'board director', 'company executive',
-}
+})
 
 # Words that should never start a person's name
-INVALID_FIRST_WORDS: Set[str] = {
+INVALID_FIRST_WORDS: FrozenSet[str] = frozenset({
     'the', 'a', 'an', 'new', 'former', 'current', 'acting', 'interim',
     'its', 'their', 'our', 'your', 'his', 'her', 'this', 'that',
     'brings', 'quietly', 'business', 'walmart', 'kroger', 'tyson',
@@ -58,10 +67,10 @@ INVALID_FIRST_WORDS: Set[str] = {
     'vet', 'veteran', 'longtime', 'seasoned', 'senior', 'junior',
     'chief', 'ceo', 'cfo', 'coo', 'cto', 'cmo', 'vp', 'svp', 'evp',
     'director', 'manager', 'head', 'leader', 'founder', 'owner',
-}
+})
 
 # Words that should never end a person's name
-INVALID_LAST_WORDS: Set[str] = {
+INVALID_LAST_WORDS: FrozenSet[str] = frozenset({
     'news', 'grocer', 'dive', 'wire', 'times', 'journal', 'post',
     'tribune', 'herald', 'gazette', 'press', 'media', 'report',
     'foods', 'farms', 'inc', 'corp', 'corporation', 'company', 'co',
@@ -69,18 +78,109 @@ INVALID_LAST_WORDS: Set[str] = {
     'experience', 'chief', 'executive', 'lawsuit', 'helm',
     'ceo', 'cfo', 'coo', 'cto', 'cmo', 'vp', 'svp', 'evp',
     'up', 'down', 'on', 'off', 'out', 'in', 'here', 'there',
-}
+})
+
+# Second words of publication/company names ("X News", "X Dive", "X Wire", ...)
+INVALID_SECOND_WORDS: FrozenSet[str] = frozenset({
+    'news', 'dive', 'wire', 'grocer', 'times', 'journal',
+    'post', 'tribune', 'herald', 'gazette', 'foods',
+    'farms', 'brands', 'executive',
+})
+
+# Verbs that get captured as the last word of a name
+VERBS_AS_NAMES: FrozenSet[str] = frozenset({
+    'promoted', 'appointed', 'named', 'hired', 'takes',
+    'joins', 'becomes', 'steps', 'moves', 'brings',
+})
+
+# Political figures that follow "President"
+POLITICAL_NAMES: FrozenSet[str] = frozenset({'trump', 'biden', 'obama', 'bush', 'clinton'})
+
+# Short words that never appear in the middle of a person's name
+NON_NAME_MIDDLE_WORDS: FrozenSet[str] = frozenset({
+    'and', 'or', 'the', 'of', 'for', 'at', 'in', 'on',
+    'to', 'as', 'its', 'their', 'new', 'next',
+})
+
+WHITESPACE_RE = re.compile(r'\s+')
+XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+WORD_RE = re.compile(r'\w+')
+
+# Lowercased first word of each executive title, for a cheap token prefilter
+TITLE_FIRST_WORDS: FrozenSet[str] = frozenset(
+    WORD_RE.match(title.lower()).group() for title in EXECUTIVE_TITLES
+)
+
+# "John Smith", "John Q. Smith", "Mary Ann Jones"
+PERSON_NAME_PATTERN = r'[A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?'
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for regex \\b."""
+    return char.isalnum() or char == '_'
+
+
+@lru_cache(maxsize=4096)
+def _parse_standard_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 or RFC 2822 date with the standard library.
+
+    Cached, since feeds repeat the same dates every run; these formats are
+    complete dates, so the result never depends on when they are parsed.
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(date_str)
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_feed_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a feed date string.
+
+    Feeds almost always use ISO 8601 (Atom) or RFC 2822 (RSS), which the
+    standard library parses far faster than dateutil; anything else falls
+    back to dateutil. That fallback is not cached, because dateutil fills
+    missing fields of partial dates ("Monday", "Feb 2026") from today.
+    """
+    parsed = _parse_standard_date(date_str)
+    if parsed is not None:
+        return parsed
+    try:
+        return date_parser.parse(date_str)
+    except (ValueError, TypeError):
+        return None
 
 
 class ArticleParser:
     """Parse article content to extract executive move information."""
 
-    def __init__(self):
-        # Build regex patterns for title matching
-        self.title_patterns = self._build_title_patterns()
-        self.action_patterns = self._build_action_patterns()
+    __slots__ = ('title_patterns', 'full_title_patterns', 'action_patterns',
+                 'name_patterns', 'move_automaton')
 
-    def _build_title_patterns(self) -> List[re.Pattern]:
+    def __init__(self):
+        # Regex patterns for title matching, shared by all parsers
+        (self.title_patterns, self.full_title_patterns, self.action_patterns,
+         self.name_patterns, self.move_automaton) = self._shared_patterns()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _shared_patterns(cls) -> Tuple:
+        """Build the patterns once; they only depend on module constants."""
+        return (
+            cls._build_title_patterns(),
+            cls._build_full_title_patterns(),
+            cls._build_action_patterns(),
+            cls._build_name_patterns(),
+            cls._build_move_automaton() if HAS_AHOCORASICK else None,
+        )
+
+    @staticmethod
+    def _build_title_patterns() -> List[re.Pattern]:
         """Build regex patterns for job titles."""
         patterns = []
         for title in EXECUTIVE_TITLES:
@@ -92,7 +192,19 @@ class ArticleParser:
             patterns.append(pattern)
         return patterns
 
-    def _build_action_patterns(self) -> List[Tuple[re.Pattern, str]]:
+    @staticmethod
+    def _build_full_title_patterns() -> List[re.Pattern]:
+        """Build patterns for a job title with its modifiers, parallel to title_patterns."""
+        return [
+            re.compile(
+                rf'(?:as|to|new)\s+((?:\w+\s+)*{re.escape(title)}(?:\s+of\s+\w+)?)',
+                re.IGNORECASE
+            )
+            for title in EXECUTIVE_TITLES
+        ]
+
+    @staticmethod
+    def _build_action_patterns() -> List[Tuple[re.Pattern, str]]:
         """Build regex patterns for action words with their meanings."""
         actions = [
             (r'\bappointed\s+(?:as\s+)?(.+?)(?:\.|,|$)', 'appointed'),
@@ -104,52 +216,104 @@ class ArticleParser:
         ]
         return [(re.compile(p, re.IGNORECASE), a) for p, a in actions]
 
-    def is_executive_move(self, title: str, content: str = "") -> bool:
-        """Check if article is about an executive move."""
-        combined_text = f"{title} {content}".lower()
-
-        # Check for executive keywords
-        keyword_match = any(kw in combined_text for kw in EXECUTIVE_KEYWORDS)
-        if not keyword_match:
-            return False
-
-        # Check for job titles
-        title_match = any(p.search(combined_text) for p in self.title_patterns)
-        return title_match
-
-    def extract_person_name(self, text: str) -> Optional[str]:
-        """Extract person name from text."""
-        # Common patterns for names in announcements
+    @staticmethod
+    def _build_name_patterns() -> List[re.Pattern]:
+        """Build regex patterns for person names in announcements."""
+        # (before, after) context around PERSON_NAME_PATTERN for each pattern
         # Note: Order matters - more specific patterns should come first
-        patterns = [
+        contexts = [
             # "Appoints/Names John Smith as..." (PR Newswire headline style)
-            r'(?:Appoints|Names|Taps|Hires|Promotes|Selects|Elevates)\s+([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:as|to|for|Group)',
+            (r'(?:Appoints|Names|Taps|Hires|Promotes|Selects|Elevates)\s+', r'\s+(?:as|to|for|Group)'),
             # "Appointment of John Smith..." (PR Newswire style)
-            r'Appointment\s+of\s+([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
+            (r'Appointment\s+of\s+', ''),
             # "John Smith has been appointed..."
-            r'^([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:has been|was|is|will)',
+            (r'^', r'\s+(?:has been|was|is|will)'),
             # "...appointed John Smith as..." (lowercase)
-            r'(?:appointed|named|hired|promotes?|taps|selects|elevates)\s+([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:as|to|for)',
+            (r'(?:appointed|named|hired|promotes?|taps|selects|elevates)\s+', r'\s+(?:as|to|for)'),
             # "...welcomes John Smith..."
-            r'(?:welcomes?|announces?)\s+([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
+            (r'(?:welcomes?|announces?)\s+', ''),
             # "John Smith joins..."
-            r'([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:joins|named|appointed|to lead|to head|becomes)',
+            ('', r'\s+(?:joins|named|appointed|to lead|to head|becomes)'),
             # "John Smith, CEO..."
-            r'([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),?\s+(?:the new|new|as|named)',
+            ('', r',?\s+(?:the new|new|as|named)'),
             # "CEO John Smith..."
-            r'(?:CEO|President|CFO|COO|VP|Director)\s+([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
+            (r'(?:CEO|President|CFO|COO|VP|Director)\s+', ''),
             # "...names John Smith CEO..."
-            r'names\s+([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:CEO|President|CFO|COO|VP|Director|Chief)',
+            (r'names\s+', r'\s+(?:CEO|President|CFO|COO|VP|Director|Chief)'),
             # "...John Smith to CEO..."
-            r'([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+to\s+(?:CEO|President|CFO|COO|VP|Director|Chief)',
+            ('', r'\s+to\s+(?:CEO|President|CFO|COO|VP|Director|Chief)'),
             # "...hires John Smith..."
-            r'hires\s+([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
+            (r'hires\s+', ''),
             # "John Smith promoted..."
-            r'([A-Z][a-z]+\s+(?:[A-Z]\.?\s+)?[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:promoted|elevated|tapped)',
+            ('', r'\s+(?:promoted|elevated|tapped)'),
         ]
+        return [
+            re.compile(rf'{before}({PERSON_NAME_PATTERN}){after}')
+            for before, after in contexts
+        ]
+
+    @staticmethod
+    def _build_move_automaton() -> 'ahocorasick.Automaton':
+        """Build one automaton over executive keywords and (lowercased) job titles."""
+        automaton = ahocorasick.Automaton()
+        for keyword in EXECUTIVE_KEYWORDS:
+            automaton.add_word(keyword, ('keyword', len(keyword)))
+        for title in EXECUTIVE_TITLES:
+            title = title.lower()
+            # A title that is also a keyword counts as both
+            kind = 'both' if title in EXECUTIVE_KEYWORDS else 'title'
+            automaton.add_word(title, (kind, len(title)))
+        automaton.make_automaton()
+        return automaton
+
+    def is_executive_move(self, title: str, content: str = "") -> bool:
+        """Check if article is about an executive move."""
+        return self._is_executive_move_text(f"{title} {content}".lower())
 
-        for pattern in patterns:
-            match = re.search(pattern, text)
+    def _is_executive_move_text(self, combined_text: str) -> bool:
+        """is_executive_move on already lowercased "title content" text."""
+        if self.move_automaton is not None:
+            return self._has_keyword_and_title(combined_text)
+
+        # Check for executive keywords
+        keyword_match = any(kw in combined_text for kw in EXECUTIVE_KEYWORDS)
+        if not keyword_match:
+            return False
+
+        # Every title pattern starts with a whole word, so unless one of
+        # those first words appears the title regexes cannot match
+        if TITLE_FIRST_WORDS.isdisjoint(WORD_RE.findall(combined_text)):
+            return False
+
+        # Check for job titles
+        title_match = any(p.search(combined_text) for p in self.title_patterns)
+        return title_match
+
+    def _has_keyword_and_title(self, text: str) -> bool:
+        """
+        Single-pass equivalent of the keyword and title checks.
+
+        Keywords match as substrings; titles need word boundaries on both
+        sides, like the \\b...\\b title_patterns.
+        """
+        saw_keyword = saw_title = False
+        for end, (kind, length) in self.move_automaton.iter(text):
+            if kind != 'title':
+                saw_keyword = True
+            if kind != 'keyword' and not saw_title:
+                start = end - length + 1
+                saw_title = (
+                    (start == 0 or not _is_word_char(text[start - 1])) and
+                    (end + 1 == len(text) or not _is_word_char(text[end + 1]))
+                )
+            if saw_keyword and saw_title:
+                return True
+        return False
+
+    def extract_person_name(self, text: str) -> Optional[str]:
+        """Extract person name from text."""
+        for pattern in self.name_patterns:
+            match = pattern.search(text)
             if match:
                 name = match.group(1).strip()
                 # Validate the extracted name
@@ -176,15 +340,14 @@ class ArticleParser:
         words = name.split()
         if not (2 <= len(words) <= 4):
             return False
+        words_lower = name_lower.split()
 
         # Check first word against invalid first words
-        first_word = words[0].lower()
-        if first_word in INVALID_FIRST_WORDS:
+        if words_lower[0] in INVALID_FIRST_WORDS:
             return False
 
         # Check last word against invalid last words
-        last_word = words[-1].lower()
-        if last_word in INVALID_LAST_WORDS:
+        if words_lower[-1] in INVALID_LAST_WORDS:
             return False
 
         # Check that first word looks like a first name (starts with capital, rest lowercase)
@@ -194,41 +357,30 @@ class ArticleParser:
 
         # Check for common publication/company patterns
         # "X News", "X Dive", "X Wire", etc.
-        if len(words) >= 2:
-            second_word_lower = words[1].lower()
-            if second_word_lower in {'news', 'dive', 'wire', 'grocer', 'times', 'journal',
-                                      'post', 'tribune', 'herald', 'gazette', 'foods',
-                                      'farms', 'brands', 'executive'}:
-                return False
+        if words_lower[1] in INVALID_SECOND_WORDS:
+            return False
 
         # Check that the name doesn't contain suspicious patterns
         # e.g., "Liate Stehlik Promoted" - check if last word is a verb
-        verbs_as_names = {'promoted', 'appointed', 'named', 'hired', 'takes',
-                          'joins', 'becomes', 'steps', 'moves', 'brings'}
-        if words[-1].lower() in verbs_as_names:
+        if words_lower[-1] in VERBS_AS_NAMES:
             return False
 
         # Check for "President X" pattern where X is a political figure
-        if len(words) >= 2 and words[0].lower() == 'president':
-            # Allow "President" as a title only if followed by a regular name
-            # but filter out "President Trump", "President Biden", etc.
-            political_names = {'trump', 'biden', 'obama', 'bush', 'clinton'}
-            if words[1].lower() in political_names:
-                return False
+        # Allow "President" as a title only if followed by a regular name
+        # but filter out "President Trump", "President Biden", etc.
+        if words_lower[0] == 'president' and words_lower[1] in POLITICAL_NAMES:
+            return False
 
         # Additional check: name should not contain common non-name words in middle
-        middle_words = words[1:-1] if len(words) > 2 else []
-        non_name_middle_words = {'and', 'or', 'the', 'of', 'for', 'at', 'in', 'on',
-                                  'to', 'as', 'its', 'their', 'new', 'next'}
-        for word in middle_words:
-            if word.lower() in non_name_middle_words and len(word) <= 3:
+        for word in words_lower[1:-1]:
+            if word in NON_NAME_MIDDLE_WORDS and len(word) <= 3:
                 return False
 
         return True
 
     def extract_title(self, text: str) -> Optional[str]:
         """Extract job title from text."""
-        for pattern in self.title_patterns:
+        for pattern, full_title_pattern in zip(self.title_patterns, self.full_title_patterns):
             match = pattern.search(text)
             if match:
                 # Get surrounding context
@@ -236,12 +388,9 @@ class ArticleParser:
                 end = min(len(text), match.end() + 50)
                 context = text[start:end]
 
-                # Try to get full title with modifiers
-                full_title_match = re.search(
-                    rf'(?:as|to|new)\s+((?:\w+\s+)*{re.escape(match.group())}(?:\s+of\s+\w+)?)',
-                    context,
-                    re.IGNORECASE
-                )
+                # Try to get full title with modifiers. The matched text is
+                # the title itself up to case, so its precompiled pattern fits.
+                full_title_match = full_title_pattern.search(context)
                 if full_title_match:
                     return full_title_match.group(1).strip()
 
@@ -249,9 +398,14 @@ class ArticleParser:
 
         return None
 
-    def extract_action(self, text: str) -> Optional[str]:
-        """Determine the type of executive move (appointed, promoted, etc.)."""
-        text_lower = text.lower()
+    def extract_action(self, text: str, text_lower: str = None) -> Optional[str]:
+        """
+        Determine the type of executive move (appointed, promoted, etc.).
+
+        text_lower can be passed when the caller already lowercased text.
+        """
+        if text_lower is None:
+            text_lower = text.lower()
 
         if 'promoted' in text_lower:
             return 'promoted to'
@@ -270,20 +424,38 @@ class ArticleParser:
 
     def clean_html(self, html_content: str) -> str:
         """Remove HTML tags and clean up text."""
-        soup = BeautifulSoup(html_content, 'lxml')
-        text = soup.get_text(separator=' ')
+        # Plain text (no tags or entities) needs no parsing
+        if '<' not in html_content and '&' not in html_content:
+            return WHITESPACE_RE.sub(' ', html_content).strip()
+
+        try:
+            doc = lxml.html.document_fromstring(html_content)
+        except ValueError:
+            # lxml refuses str input that starts with an XML encoding
+            # declaration; the text is already decoded, so drop it
+            stripped = XML_DECLARATION_RE.sub('', html_content, count=1)
+            if stripped == html_content:
+                raise
+            return self.clean_html(stripped)
+        except ParserError:
+            # Nothing but markup without text, e.g. a lone comment
+            return ''
+
+        # Like BeautifulSoup's get_text, leave out script/style contents but
+        # keep the text around them as separate pieces
+        for element in list(doc.iter('script', 'style', 'template')):
+            element.text = None
+            element[:] = []
+
+        text = ' '.join(doc.itertext())
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return WHITESPACE_RE.sub(' ', text).strip()
 
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats."""
         if not date_str:
             return None
-        try:
-            return date_parser.parse(date_str)
-        except (ValueError, TypeError):
-            return None
+        return parse_feed_date(date_str)
 
     def parse_article(self, title: str, content: str, published_date: str = None,
                       source_url: str = None, source_name: str = None,
@@ -303,9 +475,11 @@ class ArticleParser:
         # Clean content
         clean_content = self.clean_html(content) if content else ""
         combined_text = f"{title} {clean_content}"
+        # Lowercased once for the keyword, title and action checks
+        combined_lower = combined_text.lower()
 
         # Check if this is an executive move article
-        if not self.is_executive_move(title, clean_content):
+        if not self._is_executive_move_text(combined_lower):
             return None
 
         # Parse the RSS published date (not dates from content)
@@ -313,7 +487,6 @@ class ArticleParser:
 
         # Filter by age if max_age_days specified
         if max_age_days and announcement_date:
-            from datetime import timedelta
             cutoff = datetime.now() - timedelta(days=max_age_days)
             # Handle timezone-aware datetimes
             ann_date = announcement_date.replace(tzinfo=None) if announcement_date.tzinfo else announcement_date
@@ -323,7 +496,7 @@ class ArticleParser:
         # Extract information
         person_name = self.extract_person_name(combined_text)
         new_title = self.extract_title(combined_text)
-        action = self.extract_action(combined_text)
+        action = self.extract_action(combined_text, combined_lower)
 
         # Must have a valid person name to be useful
         # (title alone is not enough - we need to know WHO was appointed)
@@ -341,6 +514,16 @@ class ArticleParser:
         }
 
 
+def parse_article_fields(fields: Tuple) -> Optional[Dict]:
+    """
+    ArticleParser.parse_article on a tuple of its positional arguments.
+
+    Top-level so batches of articles can be parsed in a process pool.
+    Parsers share their compiled patterns, so creating one here is cheap.
+    """
+    return ArticleParser().parse_article(*fields)
+
+
 def find_company_in_text(text: str, companies: List[Dict]) -> Optional[Dict]:
     """
     Find which company is mentioned in the text.
@@ -365,3 +548,62 @@ def find_company_in_text(text: str, companies: List[Dict]) -> Optional[Dict]:
                 return company
 
     return None
+
+
+class CompanyMatcher:
+    """
+    Find which of many companies is mentioned in a text.
+
+    Equivalent to find_company_in_text: names and aliases match as
+    case-insensitive substrings, and the first-listed company wins. Needles
+    are lowercased once up front. With pyahocorasick installed, all of them
+    are found in one pass over the text; otherwise each is checked with a
+    C-level substring search (a combined regex alternation is slower here,
+    since Python's re tries every alternative at every position).
+    """
+
+    def __init__(self, companies: List[Dict]):
+        # (lowercased name or alias, company) in priority order; a needle
+        # shared by several companies only needs checking for the first
+        self._needles: List[Tuple[str, Dict]] = []
+        seen: Set[str] = set()
+        for company in companies:
+            for needle in [company['name'], *company.get('aliases', [])]:
+                needle = needle.lower()
+                if needle not in seen:
+                    seen.add(needle)
+                    self._needles.append((needle, company))
+
+        self._automaton = None
+        self._empty_priority = None  # an empty needle matches every text
+        if HAS_AHOCORASICK:
+            self._automaton = ahocorasick.Automaton()
+            for priority, (needle, _) in enumerate(self._needles):
+                if needle:
+                    self._automaton.add_word(needle, priority)
+                elif self._empty_priority is None:
+                    self._empty_priority = priority
+            if len(self._automaton):
+                self._automaton.make_automaton()
+            else:
+                self._automaton = None
+
+    def find(self, text: str) -> Optional[Dict]:
+        """Return the first-listed company mentioned in text, or None."""
+        text_lower = text.lower()
+
+        if not HAS_AHOCORASICK:
+            for needle, company in self._needles:
+                if needle in text_lower:
+                    return company
+            return None
+
+        best = self._empty_priority
+        if self._automaton is not None:
+            for _, priority in self._automaton.iter(text_lower):
+                if best is None or priority < best:
+                    best = priority
+                    if best == 0:
+                        break
+
+        return self._needles[best][1] if best is not None else None
@@ -1,6 +1,8 @@
 """
 RSS feed source definitions for People on the Move.
 """
+import urllib.parse
+from functools import lru_cache
 
 # Google News RSS search (free, no API key required)
 GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
@@ -306,14 +308,47 @@ DOMAIN_TO_COMPANY = {
 }
 
 
+def _build_domain_trie(domain_to_company: dict) -> dict:
+    """
+    Build a trie of domain labels, last label first.
+
+    Each node maps a label to its child node; the None key holds the
+    company for a domain ending at that node.
+    """
+    trie = {}
+    for domain, company in domain_to_company.items():
+        node = trie
+        for label in reversed(domain.lower().split('.')):
+            node = node.setdefault(label, {})
+        node[None] = company
+    return trie
+
+
+# Reversed-label trie over DOMAIN_TO_COMPANY, so subdomains resolve too
+DOMAIN_TRIE = _build_domain_trie(DOMAIN_TO_COMPANY)
+
+
 def get_prnewswire_company_url(company_name: str) -> str:
     """Get PR Newswire company page URL if available."""
     return PR_NEWSWIRE_COMPANIES.get(company_name)
 
 
+@lru_cache(maxsize=4096)
 def get_company_name_from_domain(domain: str) -> str:
-    """Get company name from email domain."""
-    return DOMAIN_TO_COMPANY.get(domain)
+    """
+    Get company name from email domain.
+
+    Subdomains match their longest listed parent domain, so
+    "news.tyson.com" resolves to Tyson Foods.
+    """
+    company = None
+    node = DOMAIN_TRIE
+    for label in reversed(domain.lower().split('.')):
+        node = node.get(label)
+        if node is None:
+            break
+        company = node.get(None, company)
+    return company
 
 # Search queries for finding executive moves via Google News
 # Expanded to include VP and Director level positions
@@ -428,19 +463,18 @@ EXECUTIVE_TITLES = [
 ]
 
 
+# Every configured feed, combined once at import
+ALL_RSS_FEEDS = tuple(PR_NEWSWIRE_FEEDS + BUSINESS_WIRE_FEEDS + INDUSTRY_FEEDS)
+
+
 def get_all_rss_feeds():
     """Return all configured RSS feeds."""
-    feeds = []
-    feeds.extend(PR_NEWSWIRE_FEEDS)
-    feeds.extend(BUSINESS_WIRE_FEEDS)
-    feeds.extend(INDUSTRY_FEEDS)
-    return feeds
+    return ALL_RSS_FEEDS
 
 
+@lru_cache(maxsize=4096)
 def build_google_news_url(company_name: str, query_template: str = None) -> str:
     """Build a Google News RSS search URL for a company."""
-    import urllib.parse
-
     if query_template:
         query = query_template.format(company=company_name)
     else:
@@ -1,27 +1,57 @@
 """
 Flask application for People on the Move dashboard.
 """
-import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from config import settings
-from src.database.models import get_engine, get_session, init_db
+from src.database.models import get_engine, init_db
+
+# Static files live at the project root. The app is started from there
+# (python -m src.dashboard.app, or gunicorn src.dashboard.app:app), which
+# also puts 'config' and 'src' on the import path.
+project_root = Path(__file__).parent.parent.parent
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes with orjson.
+
+    Keys are sorted like Flask's default. Datetimes and other types orjson
+    would format differently are still passed to DefaultJSONProvider.default.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 def create_app():
     """Create and configure Flask application."""
     app = Flask(
         __name__,
-        template_folder=str(project_root / 'src' / 'dashboard' / 'templates'),
+        template_folder='templates',
         static_folder=str(project_root / 'static')
     )
 
+    # Serialize API responses with orjson when it is installed
+    if HAS_ORJSON:
+        app.json = OrjsonProvider(app)
+
     # Configuration
     app.config['SECRET_KEY'] = settings.FLASK_SECRET_KEY
     app.config['DEBUG'] = settings.FLASK_DEBUG
@@ -36,6 +66,14 @@ def create_app():
     # Store engine in app for access in routes
     app.engine = engine
 
+    # One session per request, reused by every query in it and closed
+    # (returning its connection to the pool) when the request ends
+    app.Session = scoped_session(sessionmaker(bind=engine, expire_on_commit=False))
+
+    @app.teardown_appcontext
+    def remove_session(exc=None):
+        app.Session.remove()
+
     # Register routes
     from .routes import bp as routes_bp
     app.register_blueprint(routes_bp)
@@ -0,0 +1,44 @@
+"""
+In-process TTL cache for dashboard reads.
+
+Dashboard polls hit the same aggregate queries over and over; results are
+kept for a few seconds and dropped whenever a route changes announcements
+or posts. The aggregator runs as a separate process, so its inserts show
+up once the TTL expires.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+# Seconds cached reads stay fresh
+STATS_TTL = 10
+ANNOUNCEMENTS_TTL = 60
+
+
+class ReadCache:
+    """Thread-safe key -> value cache with a per-entry time to live."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: str, ttl: float, load: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling load() if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        value = load()
+        with self._lock:
+            self._entries[key] = (now + ttl, value)
+        return value
+
+    def clear(self):
+        """Drop every entry, after a write."""
+        with self._lock:
+            self._entries.clear()
+
+
+read_cache = ReadCache()
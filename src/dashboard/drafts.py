@@ -0,0 +1,99 @@
+"""
+Background draft generation for the dashboard.
+
+Generating a post can take seconds when it goes through the AI API, so
+review and regenerate requests hand the work to a small thread pool and the
+page polls for the result. Jobs are keyed by announcement id, so reloading
+a page while its draft is being written does not start a second one.
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src.database import operations as db_ops
+from src.drafting.ai_generator import generate_post
+from .cache import read_cache
+
+logger = logging.getLogger(__name__)
+
+# Concurrent AI calls; drafts beyond this queue up
+DRAFT_WORKERS = 2
+
+_executor = ThreadPoolExecutor(max_workers=DRAFT_WORKERS, thread_name_prefix='draft')
+_jobs: Dict[int, Future] = {}
+_jobs_lock = threading.Lock()
+
+
+def announcement_data(announcement) -> Dict:
+    """Fields generate_post needs from an announcement."""
+    return {
+        'person_name': announcement.person_name,
+        'new_title': announcement.new_title,
+        'company_name': announcement.company.name,
+        'previous_title': announcement.previous_title,
+        'raw_text': announcement.raw_text,
+    }
+
+
+def _write_draft(app, announcement_id: int, ann_data: Dict, post_id: Optional[int]):
+    """Generate a post and save it as a new draft, or as a new version of post_id."""
+    try:
+        content = generate_post(ann_data, use_ai=True)
+
+        with app.app_context():
+            session = app.Session()
+            if post_id is None:
+                # Another request may have saved a draft in the meantime
+                if db_ops.get_post_for_announcement(session, announcement_id) is None:
+                    db_ops.create_post(session, announcement_id, content)
+            else:
+                db_ops.update_post_content(session, post_id, content)
+        read_cache.clear()
+    except Exception as e:
+        logger.error("Draft generation failed for announcement %d: %s", announcement_id, e)
+        raise
+
+
+def start_draft(app, announcement_id: int, ann_data: Dict,
+                post_id: Optional[int] = None) -> Future:
+    """
+    Queue draft generation for an announcement, unless one is already running.
+
+    Args:
+        app: Flask app, for a database session on the worker thread
+        announcement_id: Announcement to write the post for
+        ann_data: Output of announcement_data()
+        post_id: Existing post to regenerate; None creates the first draft
+
+    Returns:
+        The announcement's pending job
+    """
+    with _jobs_lock:
+        job = _jobs.get(announcement_id)
+        if job is None or job.done():
+            job = _executor.submit(_write_draft, app, announcement_id, ann_data, post_id)
+            _jobs[announcement_id] = job
+        return job
+
+
+def draft_error(announcement_id: int) -> Optional[str]:
+    """
+    Error from the announcement's last job, if it failed.
+
+    A failed job is forgotten once its error is returned, so the error is
+    reported only once.
+    """
+    with _jobs_lock:
+        job = _jobs.get(announcement_id)
+        if job is None or not job.done() or job.exception() is None:
+            return None
+        del _jobs[announcement_id]
+    return str(job.exception())
+
+
+def is_drafting(announcement_id: int) -> bool:
+    """Whether a draft is still being generated for an announcement."""
+    with _jobs_lock:
+        job = _jobs.get(announcement_id)
+    return job is not None and not job.done()
@@ -4,16 +4,49 @@ Flask routes for People on the Move dashboard.
 from datetime import datetime
 from flask import Blueprint, render_template, request, jsonify, redirect, url_for, flash, current_app
 
-from src.database.models import get_session, Announcement, Post, Company
+from src.database.models import Announcement, Post, Company
 from src.database import operations as db_ops
-from src.drafting.ai_generator import generate_post
+from .cache import read_cache, STATS_TTL, ANNOUNCEMENTS_TTL
+from . import drafts
 
 bp = Blueprint('main', __name__)
 
+# Announcements per history tab page
+HISTORY_PAGE_SIZE = 50
+
+# Status values accepted by the announcement list API
+ANNOUNCEMENT_STATUSES = frozenset({
+    Announcement.STATUS_PENDING, Announcement.STATUS_APPROVED,
+    Announcement.STATUS_REJECTED, Announcement.STATUS_POSTED,
+})
+
+# Announcement fields editors may change through the API
+ANNOUNCEMENT_UPDATE_FIELDS = frozenset({
+    'person_name', 'new_title', 'previous_title', 'previous_company',
+})
+
 
 def get_db_session():
-    """Get database session from app context."""
-    return get_session(current_app.engine)
+    """Get the request's database session (removed on app context teardown)."""
+    return current_app.Session()
+
+
+def get_cached_stats(session):
+    """Dashboard statistics, cached for STATS_TTL seconds."""
+    return read_cache.get_or_set('stats', STATS_TTL, lambda: db_ops.get_stats(session))
+
+
+def conditional_json(payload, max_age: int):
+    """
+    JSON response with an ETag and Cache-Control max-age.
+
+    A request whose If-None-Match still matches gets an empty 304 instead.
+    """
+    response = jsonify(payload)
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 # ============= Web Pages =============
@@ -22,81 +55,68 @@ def get_db_session():
 def index():
     """Dashboard home page showing pending announcements."""
     session = get_db_session()
-    try:
-        # Get announcements grouped by status
-        pending = db_ops.get_pending_announcements(session)
-        approved = db_ops.get_approved_announcements(session)
-        stats = db_ops.get_stats(session)
-
-        return render_template(
-            'index.html',
-            pending=pending,
-            approved=approved,
-            stats=stats
-        )
-    finally:
-        session.close()
+    # Get announcements grouped by status
+    pending = db_ops.get_pending_announcements(session)
+    approved = db_ops.get_approved_announcements(session)
+    stats = get_cached_stats(session)
+
+    return render_template(
+        'index.html',
+        pending=pending,
+        approved=approved,
+        stats=stats
+    )
 
 
 @bp.route('/review/<int:announcement_id>')
 def review(announcement_id):
     """Review page for a single announcement."""
     session = get_db_session()
-    try:
-        announcement = db_ops.get_announcement_by_id(session, announcement_id)
-        if not announcement:
-            flash('Announcement not found', 'error')
-            return redirect(url_for('main.index'))
-
-        # Get or generate draft post
-        post = db_ops.get_post_for_announcement(session, announcement_id)
-        if not post:
-            # Generate draft post
-            ann_data = {
-                'person_name': announcement.person_name,
-                'new_title': announcement.new_title,
-                'company_name': announcement.company.name,
-                'previous_title': announcement.previous_title,
-                'raw_text': announcement.raw_text,
-            }
-            draft_content = generate_post(ann_data)
-            post = db_ops.create_post(session, announcement_id, draft_content)
-
-        return render_template(
-            'review.html',
-            announcement=announcement,
-            post=post
+    announcement = db_ops.get_announcement_by_id(session, announcement_id)
+    if not announcement:
+        flash('Announcement not found', 'error')
+        return redirect(url_for('main.index'))
+
+    # Get draft post, or start writing one; the page polls until it is saved
+    post = db_ops.get_post_for_announcement(session, announcement_id)
+    if not post:
+        drafts.start_draft(
+            current_app._get_current_object(),
+            announcement_id,
+            drafts.announcement_data(announcement)
         )
-    finally:
-        session.close()
+
+    return render_template(
+        'review.html',
+        announcement=announcement,
+        post=post
+    )
 
 
 @bp.route('/history')
 def history():
     """View posted announcements."""
     session = get_db_session()
-    try:
-        posted = db_ops.get_announcements_by_status(session, 'posted')
-        rejected = db_ops.get_announcements_by_status(session, 'rejected')
+    # First page of each tab; the rest load from /api/history
+    posted = db_ops.get_announcements_page(session, 'posted', limit=HISTORY_PAGE_SIZE, with_posts=True)
+    rejected = db_ops.get_announcements_page(session, 'rejected', limit=HISTORY_PAGE_SIZE)
 
-        return render_template(
-            'history.html',
-            posted=posted,
-            rejected=rejected
-        )
-    finally:
-        session.close()
+    return render_template(
+        'history.html',
+        posted=posted,
+        rejected=rejected,
+        posted_count=db_ops.count_announcements_by_status(session, 'posted'),
+        rejected_count=db_ops.count_announcements_by_status(session, 'rejected'),
+        page_size=HISTORY_PAGE_SIZE
+    )
 
 
 @bp.route('/companies')
 def companies():
     """View and manage tracked companies."""
     session = get_db_session()
-    try:
-        all_companies = session.query(Company).order_by(Company.name).all()
-        return render_template('companies.html', companies=all_companies)
-    finally:
-        session.close()
+    all_companies = session.query(Company).order_by(Company.name).all()
+    return render_template('companies.html', companies=all_companies)
 
 
 # ============= API Endpoints =============
@@ -105,10 +125,13 @@ def companies():
 def api_get_announcements():
     """Get announcements with optional status filter."""
     status = request.args.get('status', 'pending')
+    # Only known statuses, so query strings cannot grow the read cache
+    if status not in ANNOUNCEMENT_STATUSES:
+        return jsonify({'success': False, 'error': 'Invalid status'}), 400
     session = get_db_session()
-    try:
+    def load():
         announcements = db_ops.get_announcements_by_status(session, status)
-        return jsonify([{
+        return [{
             'id': a.id,
             'person_name': a.person_name,
             'new_title': a.new_title,
@@ -116,9 +139,47 @@ def api_get_announcements():
             'source_url': a.source_url,
             'status': a.status,
             'created_at': a.created_at.isoformat() if a.created_at else None,
-        } for a in announcements])
-    finally:
-        session.close()
+        } for a in announcements]
+
+    # Lists change on every review action, so clients revalidate each time
+    return conditional_json(
+        read_cache.get_or_set(f'announcements:{status}', ANNOUNCEMENTS_TTL, load),
+        max_age=0
+    )
+
+
+@bp.route('/api/history', methods=['GET'])
+def api_history():
+    """Get the next page of posted or rejected announcements for the history page."""
+    status = request.args.get('status', 'posted')
+    if status not in ('posted', 'rejected'):
+        return jsonify({'success': False, 'error': 'Invalid status'}), 400
+    cursor = request.args.get('cursor', type=int)
+
+    session = get_db_session()
+    announcements = db_ops.get_announcements_page(
+        session, status, before_id=cursor, limit=HISTORY_PAGE_SIZE,
+        with_posts=(status == 'posted')
+    )
+
+    items = []
+    for a in announcements:
+        post = a.posts[0] if status == 'posted' and a.posts else None
+        items.append({
+            'id': a.id,
+            'person_name': a.person_name,
+            'new_title': a.new_title,
+            'company': a.company.name,
+            'updated_at': a.updated_at.strftime('%Y-%m-%d') if a.updated_at else None,
+            'posted_at': post.posted_at.strftime('%Y-%m-%d') if post and post.posted_at else None,
+            'linkedin_url': post.linkedin_url if post else None,
+            'has_post': post is not None,
+        })
+
+    return jsonify({
+        'items': items,
+        'next_cursor': announcements[-1].id if len(announcements) == HISTORY_PAGE_SIZE else None
+    })
 
 
 @bp.route('/api/announcement/<int:announcement_id>/approve', methods=['POST'])
@@ -129,19 +190,12 @@ def api_approve(announcement_id):
         data = request.get_json() or {}
         approved_by = data.get('approved_by', 'editor')
 
-        # Get or create post
-        post = db_ops.get_post_for_announcement(session, announcement_id)
-        if post:
-            db_ops.approve_post(session, post.id, approved_by)
-        else:
-            # Just update announcement status
-            db_ops.update_announcement_status(session, announcement_id, 'approved')
+        db_ops.approve_announcement(session, announcement_id, approved_by)
+        read_cache.clear()
 
         return jsonify({'success': True, 'status': 'approved'})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @bp.route('/api/announcement/<int:announcement_id>/reject', methods=['POST'])
@@ -150,11 +204,10 @@ def api_reject(announcement_id):
     session = get_db_session()
     try:
         db_ops.update_announcement_status(session, announcement_id, 'rejected')
+        read_cache.clear()
         return jsonify({'success': True, 'status': 'rejected'})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @bp.route('/api/announcement/<int:announcement_id>/posted', methods=['POST'])
@@ -165,17 +218,12 @@ def api_mark_posted(announcement_id):
         data = request.get_json() or {}
         linkedin_url = data.get('linkedin_url')
 
-        post = db_ops.get_post_for_announcement(session, announcement_id)
-        if post:
-            db_ops.mark_post_as_posted(session, post.id, linkedin_url)
-        else:
-            db_ops.update_announcement_status(session, announcement_id, 'posted')
+        db_ops.mark_announcement_posted(session, announcement_id, linkedin_url)
+        read_cache.clear()
 
         return jsonify({'success': True, 'status': 'posted'})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @bp.route('/api/post/<int:post_id>/update', methods=['POST'])
@@ -199,54 +247,65 @@ def api_update_post(post_id):
         return jsonify({'success': False, 'error': 'Post not found'}), 404
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @bp.route('/api/post/<int:post_id>/regenerate', methods=['POST'])
 def api_regenerate_post(post_id):
-    """Regenerate post content using AI."""
+    """Start regenerating post content using AI; poll the announcement's post for the result."""
     session = get_db_session()
     try:
-        post = db_ops.get_post_by_id(session, post_id)
+        post = db_ops.get_post_by_id(session, post_id, with_announcement=True)
         if not post:
             return jsonify({'success': False, 'error': 'Post not found'}), 404
 
-        announcement = post.announcement
-
-        # Generate new content
-        ann_data = {
-            'person_name': announcement.person_name,
-            'new_title': announcement.new_title,
-            'company_name': announcement.company.name,
-            'previous_title': announcement.previous_title,
-            'raw_text': announcement.raw_text,
-        }
-        new_content = generate_post(ann_data, use_ai=True)
-
-        # Update post
-        post = db_ops.update_post_content(session, post_id, new_content)
+        drafts.start_draft(
+            current_app._get_current_object(),
+            post.announcement_id,
+            drafts.announcement_data(post.announcement),
+            post_id=post.id
+        )
 
         return jsonify({
             'success': True,
-            'content': post.content,
+            'pending': True,
             'version': post.version
-        })
+        }), 202
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
+
+
+@bp.route('/api/announcement/<int:announcement_id>/post', methods=['GET'])
+def api_get_announcement_post(announcement_id):
+    """Get an announcement's latest post, or whether its draft is still being written."""
+    error = drafts.draft_error(announcement_id)
+
+    if not error and drafts.is_drafting(announcement_id):
+        return jsonify({'success': True, 'pending': True})
+
+    session = get_db_session()
+    post = db_ops.get_post_for_announcement(session, announcement_id)
+    if not post:
+        if error:
+            return jsonify({'success': False, 'error': error}), 500
+        return jsonify({'success': False, 'error': 'Post not found'}), 404
+
+    # A failed regenerate leaves the existing post; return it with the error
+    return jsonify({
+        'success': True,
+        'pending': False,
+        'id': post.id,
+        'content': post.content,
+        'version': post.version,
+        'error': error
+    })
 
 
 @bp.route('/api/stats', methods=['GET'])
 def api_stats():
     """Get dashboard statistics."""
     session = get_db_session()
-    try:
-        stats = db_ops.get_stats(session)
-        return jsonify(stats)
-    finally:
-        session.close()
+    stats = get_cached_stats(session)
+    return conditional_json(stats, max_age=STATS_TTL)
 
 
 @bp.route('/api/announcement/<int:announcement_id>', methods=['PUT'])
@@ -257,17 +316,15 @@ def api_update_announcement(announcement_id):
         data = request.get_json() or {}
 
         # Only allow updating certain fields
-        allowed_fields = ['person_name', 'new_title', 'previous_title', 'previous_company']
-        update_data = {k: v for k, v in data.items() if k in allowed_fields}
+        update_data = {k: v for k, v in data.items() if k in ANNOUNCEMENT_UPDATE_FIELDS}
 
         if not update_data:
             return jsonify({'success': False, 'error': 'No valid fields to update'}), 400
 
         announcement = db_ops.update_announcement(session, announcement_id, **update_data)
+        read_cache.clear()
         if announcement:
             return jsonify({'success': True})
         return jsonify({'success': False, 'error': 'Announcement not found'}), 404
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
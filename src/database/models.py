@@ -1,10 +1,16 @@
 """
 SQLAlchemy database models for People on the Move.
 """
+import json
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, Date, ForeignKey
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, Boolean, DateTime, Date, ForeignKey, Index
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 Base = declarative_base()
 
 
@@ -21,22 +27,21 @@ class Company(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # Relationships
-    announcements = relationship("Announcement", back_populates="company")
+    # Relationships. Lazy loads that would query raise instead, so every
+    # query states what it eager-loads (no N+1 SELECTs from templates).
+    announcements = relationship("Announcement", back_populates="company", lazy='raise_on_sql')
 
     def __repr__(self):
         return f"<Company(id={self.id}, name='{self.name}')>"
 
     def get_aliases(self):
         """Return aliases as a list."""
-        import json
         if self.aliases:
-            return json.loads(self.aliases)
+            return json_loads(self.aliases)
         return []
 
     def set_aliases(self, alias_list):
         """Set aliases from a list."""
-        import json
         self.aliases = json.dumps(alias_list)
 
 
@@ -59,8 +64,8 @@ class Announcement(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    company = relationship("Company", back_populates="announcements")
-    posts = relationship("Post", back_populates="announcement")
+    company = relationship("Company", back_populates="announcements", lazy='raise_on_sql')
+    posts = relationship("Post", back_populates="announcement", lazy='raise_on_sql')
 
     # Valid status values
     STATUS_PENDING = 'pending'
@@ -68,6 +73,13 @@ class Announcement(Base):
     STATUS_REJECTED = 'rejected'
     STATUS_POSTED = 'posted'
 
+    __table_args__ = (
+        # Status lists and history pages: WHERE status = ? ORDER BY created_at, id
+        Index('ix_announcements_status_created', 'status', 'created_at', 'id'),
+        # Duplicate checks: WHERE company_id IN (...) AND created_at >= ?
+        Index('ix_announcements_company_created', 'company_id', 'created_at'),
+    )
+
     def __repr__(self):
         return f"<Announcement(id={self.id}, person='{self.person_name}', company_id={self.company_id})>"
 
@@ -88,23 +100,88 @@ class Post(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    announcement = relationship("Announcement", back_populates="posts")
+    announcement = relationship("Announcement", back_populates="posts", lazy='raise_on_sql')
+
+    __table_args__ = (
+        # Latest post for an announcement: WHERE announcement_id = ? ORDER BY version
+        Index('ix_posts_announcement_version', 'announcement_id', 'version'),
+    )
 
     def __repr__(self):
         return f"<Post(id={self.id}, announcement_id={self.announcement_id})>"
 
 
+def _create_engine(database_url):
+    """
+    Create database engine with pool settings only.
+
+    Pooled connections are pinged before use, since the hosted Postgres
+    drops idle ones between dashboard requests.
+    """
+    options = {'echo': False, 'pool_pre_ping': True}
+    if not database_url.startswith('sqlite'):
+        # Dashboard threads plus background draft jobs, with headroom
+        options.update(pool_size=10, max_overflow=10, pool_recycle=1800)
+    return create_engine(database_url, **options)
+
+
 def get_engine(database_url):
-    """Create database engine."""
-    return create_engine(database_url, echo=False)
+    """
+    Create database engine.
+
+    SQLite databases use write-ahead logging, so dashboard reads are not
+    blocked while the aggregator writes, and only sync at checkpoints.
+    """
+    engine = _create_engine(database_url)
+
+    if engine.dialect.name == 'sqlite':
+        @event.listens_for(engine, 'connect')
+        def _set_wal_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.close()
+
+    return engine
+
+
+def get_bulk_load_engine(database_url):
+    """
+    Create a database engine for one-off bulk imports.
+
+    On SQLite, the rollback journal is kept in memory and fsync is disabled
+    for the import's connections, so large inserts are not bound by disk
+    syncs. Only use this for scripts that can simply be re-run if interrupted.
+    """
+    engine = _create_engine(database_url)
+
+    if engine.dialect.name == 'sqlite':
+        @event.listens_for(engine, 'connect')
+        def _set_bulk_load_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=MEMORY')
+            cursor.execute('PRAGMA synchronous=OFF')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.close()
+
+    return engine
 
 
 def get_session(engine):
-    """Create a new session."""
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Create a new session, from a session factory built once per engine."""
+    # Kept on the engine itself, so it goes away with the engine
+    factory = getattr(engine, '_potm_sessionmaker', None)
+    if factory is None:
+        factory = engine._potm_sessionmaker = sessionmaker(bind=engine)
+    return factory()
 
 
 def init_db(engine):
-    """Initialize database tables."""
+    """Initialize database tables and indexes."""
     Base.metadata.create_all(engine)
+
+    # create_all skips tables that already exist, so add any indexes
+    # introduced since an existing database was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
@@ -2,13 +2,18 @@
 Database CRUD operations for People on the Move.
 """
 import json
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional
-from sqlalchemy import or_, and_
-from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import or_, and_, bindparam, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from .models import Company, Announcement, Post
 
+# Statements reused on every call, built once at import
+_COMPANY_BY_NAME = select(Company).where(Company.name == bindparam('name')).limit(1)
+
 
 # ============= Company Operations =============
 
@@ -27,14 +32,50 @@ def create_company(session: Session, name: str, domain: str = None,
     return company
 
 
+def bulk_create_companies(session: Session, rows: List[Dict]) -> int:
+    """
+    Insert many companies with a single executemany statement.
+
+    Each row is a dict of Company column values; an 'aliases' list is
+    JSON-encoded (the caller's dicts are left unchanged). On SQLite and
+    PostgreSQL, rows whose name already exists are skipped by the database
+    (ON CONFLICT DO NOTHING), so concurrent or repeated imports stay
+    idempotent. The caller is responsible for committing.
+
+    Returns:
+        Number of companies actually inserted
+    """
+    if not rows:
+        return 0
+
+    rows = [
+        dict(row, aliases=json.dumps(row['aliases']))
+        if isinstance(row.get('aliases'), list) else row
+        for row in rows
+    ]
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        stmt = postgresql.insert(Company).on_conflict_do_nothing(index_elements=['name'])
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(Company).on_conflict_do_nothing(index_elements=['name'])
+    else:
+        # No conflict clause: every row is inserted or the statement fails
+        session.execute(insert(Company), rows)
+        return len(rows)
+
+    # Skipped rows return nothing, so RETURNING counts only real inserts
+    return len(session.scalars(stmt.returning(Company.id), rows).all())
+
+
 def get_company_by_name(session: Session, name: str) -> Optional[Company]:
     """Find company by exact name."""
-    return session.query(Company).filter(Company.name == name).first()
+    return session.scalars(_COMPANY_BY_NAME, {'name': name}).first()
 
 
 def get_company_by_id(session: Session, company_id: int) -> Optional[Company]:
     """Find company by ID."""
-    return session.query(Company).filter(Company.id == company_id).first()
+    return session.get(Company, company_id)
 
 
 def get_active_companies(session: Session) -> List[Company]:
@@ -53,7 +94,13 @@ def search_company(session: Session, search_term: str) -> Optional[Company]:
         return company
 
     # Search in aliases (stored as JSON)
-    companies = session.query(Company).filter(Company.is_active == True).all()
+    query = session.query(Company).filter(Company.is_active == True)
+    if (search_term.isascii() and search_term.isprintable()
+            and '"' not in search_term and '\\' not in search_term):
+        # The term appears verbatim in the JSON text, so let the database
+        # drop companies whose aliases cannot match before decoding any
+        query = query.filter(Company.aliases.ilike(f"%{search_term}%"))
+    companies = query.all()
     search_lower = search_term.lower()
 
     for company in companies:
@@ -101,36 +148,105 @@ def create_announcement(session: Session, company_id: int, person_name: str,
     return announcement
 
 
+def bulk_create_announcements(session: Session, rows: List[Dict]) -> List[int]:
+    """
+    Create many pending announcements with a single executemany INSERT.
+
+    Returns the new announcement IDs in the same order as rows. The caller's
+    dicts are left unchanged.
+    """
+    if not rows:
+        return []
+
+    rows = [dict(row, status=row.get('status', Announcement.STATUS_PENDING)) for row in rows]
+
+    ids = session.scalars(
+        insert(Announcement).returning(Announcement.id, sort_by_parameter_order=True),
+        rows
+    ).all()
+    session.commit()
+    return list(ids)
+
+
 def get_announcement_by_id(session: Session, announcement_id: int) -> Optional[Announcement]:
     """Get announcement by ID."""
-    return session.query(Announcement).filter(Announcement.id == announcement_id).first()
+    return session.get(Announcement, announcement_id,
+                       options=[joinedload(Announcement.company)])
 
 
 def get_pending_announcements(session: Session) -> List[Announcement]:
     """Get all pending announcements."""
-    return session.query(Announcement).filter(
+    return session.query(Announcement).options(
+        selectinload(Announcement.company)
+    ).filter(
         Announcement.status == Announcement.STATUS_PENDING
     ).order_by(Announcement.created_at.desc()).all()
 
 
 def get_approved_announcements(session: Session) -> List[Announcement]:
     """Get all approved announcements ready for posting."""
-    return session.query(Announcement).filter(
+    return session.query(Announcement).options(
+        selectinload(Announcement.company)
+    ).filter(
         Announcement.status == Announcement.STATUS_APPROVED
     ).order_by(Announcement.created_at.desc()).all()
 
 
-def get_announcements_by_status(session: Session, status: str) -> List[Announcement]:
-    """Get announcements by status."""
-    return session.query(Announcement).filter(
+def get_announcements_by_status(session: Session, status: str,
+                                with_posts: bool = False) -> List[Announcement]:
+    """
+    Get announcements by status, with their companies loaded in one query.
+
+    Pass with_posts=True when the caller also reads announcement.posts.
+    """
+    options = [selectinload(Announcement.company)]
+    if with_posts:
+        options.append(selectinload(Announcement.posts))
+    return session.query(Announcement).options(*options).filter(
         Announcement.status == status
     ).order_by(Announcement.created_at.desc()).all()
 
 
+def get_announcements_page(session: Session, status: str, before_id: int = None,
+                           limit: int = 50, with_posts: bool = False) -> List[Announcement]:
+    """
+    Get one page of announcements by status, newest first.
+
+    Pages are keyed on (created_at, id) rather than an offset: pass the id of
+    the last announcement of the previous page as before_id.
+    """
+    options = [selectinload(Announcement.company)]
+    if with_posts:
+        options.append(selectinload(Announcement.posts))
+    query = session.query(Announcement).options(*options).filter(
+        Announcement.status == status
+    )
+    if before_id is not None:
+        before_created = select(Announcement.created_at).where(
+            Announcement.id == before_id
+        ).scalar_subquery()
+        query = query.filter(or_(
+            Announcement.created_at < before_created,
+            and_(Announcement.created_at == before_created, Announcement.id < before_id)
+        ))
+    return query.order_by(
+        Announcement.created_at.desc(), Announcement.id.desc()
+    ).limit(limit).all()
+
+
+def count_announcements_by_status(session: Session, status: str) -> int:
+    """Count announcements with a status."""
+    return session.scalar(
+        select(func.count(Announcement.id)).where(Announcement.status == status)
+    )
+
+
 def get_recent_announcements(session: Session, days: int = 30) -> List[Announcement]:
-    """Get announcements from the last N days."""
+    """Get announcements from the last N days, with their companies loaded in one query."""
     cutoff = datetime.utcnow() - timedelta(days=days)
-    return session.query(Announcement).filter(
+    return session.query(Announcement).options(
+        selectinload(Announcement.company)
+    ).filter(
         Announcement.created_at >= cutoff
     ).order_by(Announcement.created_at.desc()).all()
 
@@ -148,14 +264,41 @@ def check_duplicate(session: Session, company_id: int, person_name: str,
     ).first()
 
 
+def get_recent_person_names(session: Session, company_ids: Iterable[int],
+                            hours: int = 24) -> Dict[int, List[str]]:
+    """Map company ID to person names announced within the time window."""
+    company_ids = set(company_ids)
+    if not company_ids:
+        return {}
+
+    cutoff = datetime.utcnow() - timedelta(hours=hours)
+    rows = session.query(Announcement.company_id, Announcement.person_name).filter(
+        Announcement.company_id.in_(company_ids),
+        Announcement.created_at >= cutoff
+    ).all()
+
+    names = defaultdict(list)
+    for company_id, person_name in rows:
+        names[company_id].append(person_name)
+    return dict(names)
+
+
 def update_announcement_status(session: Session, announcement_id: int,
                                 status: str) -> Optional[Announcement]:
     """Update announcement status."""
+    announcement = _set_announcement_status(session, announcement_id, status)
+    if announcement:
+        session.commit()
+    return announcement
+
+
+def _set_announcement_status(session: Session, announcement_id: int,
+                             status: str) -> Optional[Announcement]:
+    """Set announcement status without committing, for callers that commit once."""
     announcement = get_announcement_by_id(session, announcement_id)
     if announcement:
         announcement.status = status
         announcement.updated_at = datetime.utcnow()
-        session.commit()
     return announcement
 
 
@@ -184,9 +327,32 @@ def create_post(session: Session, announcement_id: int, content: str) -> Post:
     return post
 
 
-def get_post_by_id(session: Session, post_id: int) -> Optional[Post]:
-    """Get post by ID."""
-    return session.query(Post).filter(Post.id == post_id).first()
+def bulk_create_posts(session: Session, rows: List[Dict]) -> int:
+    """
+    Create many draft posts with a single executemany INSERT.
+
+    Each row needs announcement_id and content. Returns the number of posts.
+    """
+    if not rows:
+        return 0
+
+    session.execute(insert(Post), rows)
+    session.commit()
+    return len(rows)
+
+
+def get_post_by_id(session: Session, post_id: int,
+                   with_announcement: bool = False) -> Optional[Post]:
+    """
+    Get post by ID.
+
+    Pass with_announcement=True when the caller also reads
+    post.announcement and its company.
+    """
+    options = []
+    if with_announcement:
+        options.append(joinedload(Post.announcement).joinedload(Announcement.company))
+    return session.get(Post, post_id, options=options)
 
 
 def get_post_for_announcement(session: Session, announcement_id: int) -> Optional[Post]:
@@ -216,7 +382,7 @@ def approve_post(session: Session, post_id: int, approved_by: str) -> Optional[P
         post.updated_at = datetime.utcnow()
 
         # Also update announcement status
-        update_announcement_status(session, post.announcement_id, Announcement.STATUS_APPROVED)
+        _set_announcement_status(session, post.announcement_id, Announcement.STATUS_APPROVED)
         session.commit()
     return post
 
@@ -231,27 +397,79 @@ def mark_post_as_posted(session: Session, post_id: int,
         post.updated_at = datetime.utcnow()
 
         # Also update announcement status
-        update_announcement_status(session, post.announcement_id, Announcement.STATUS_POSTED)
+        _set_announcement_status(session, post.announcement_id, Announcement.STATUS_POSTED)
         session.commit()
     return post
 
 
+def _latest_post_id(announcement_id: int):
+    """Subquery for the id get_post_for_announcement would return."""
+    return select(Post.id).where(
+        Post.announcement_id == announcement_id
+    ).order_by(Post.version.desc()).limit(1).scalar_subquery()
+
+
+def _set_status_with_post(session: Session, announcement_id: int, status: str,
+                          **post_values):
+    """
+    Set an announcement's status and update its latest post, if it has one.
+
+    Two UPDATE statements in one transaction, without loading either row.
+    Matching objects already in the session are updated to match.
+    """
+    now = datetime.utcnow()
+    session.execute(
+        update(Announcement)
+        .where(Announcement.id == announcement_id)
+        .values(status=status, updated_at=now)
+    )
+    session.execute(
+        update(Post)
+        .where(Post.id == _latest_post_id(announcement_id))
+        .values(updated_at=now, **post_values)
+    )
+    session.commit()
+
+
+def approve_announcement(session: Session, announcement_id: int, approved_by: str):
+    """Approve an announcement and its latest post."""
+    _set_status_with_post(
+        session, announcement_id, Announcement.STATUS_APPROVED,
+        approved_by=approved_by,
+        approved_at=datetime.utcnow()
+    )
+
+
+def mark_announcement_posted(session: Session, announcement_id: int,
+                             linkedin_url: str = None):
+    """Mark an announcement and its latest post as published to LinkedIn."""
+    _set_status_with_post(
+        session, announcement_id, Announcement.STATUS_POSTED,
+        posted_at=datetime.utcnow(),
+        linkedin_url=linkedin_url
+    )
+
+
 # ============= Statistics =============
 
 def get_stats(session: Session) -> dict:
-    """Get summary statistics."""
+    """Get summary statistics: company and post counts in one query, statuses in another."""
+    total_companies, active_companies, total_posts = session.execute(select(
+        select(func.count(Company.id)).scalar_subquery(),
+        select(func.count(Company.id)).where(Company.is_active == True).scalar_subquery(),
+        select(func.count(Post.id)).scalar_subquery(),
+    )).one()
+
+    by_status = dict(session.execute(
+        select(Announcement.status, func.count(Announcement.id)).group_by(Announcement.status)
+    ).all())
+
     return {
-        'total_companies': session.query(Company).count(),
-        'active_companies': session.query(Company).filter(Company.is_active == True).count(),
-        'total_announcements': session.query(Announcement).count(),
-        'pending_announcements': session.query(Announcement).filter(
-            Announcement.status == Announcement.STATUS_PENDING
-        ).count(),
-        'approved_announcements': session.query(Announcement).filter(
-            Announcement.status == Announcement.STATUS_APPROVED
-        ).count(),
-        'posted_announcements': session.query(Announcement).filter(
-            Announcement.status == Announcement.STATUS_POSTED
-        ).count(),
-        'total_posts': session.query(Post).count(),
+        'total_companies': total_companies,
+        'active_companies': active_companies,
+        'total_announcements': sum(by_status.values()),
+        'pending_announcements': by_status.get(Announcement.STATUS_PENDING, 0),
+        'approved_announcements': by_status.get(Announcement.STATUS_APPROVED, 0),
+        'posted_announcements': by_status.get(Announcement.STATUS_POSTED, 0),
+        'total_posts': total_posts,
     }
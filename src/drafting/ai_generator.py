@@ -10,6 +10,9 @@ from .templates import generate_post_from_template
 
 logger = logging.getLogger(__name__)
 
+# Characters of article text included in a prompt
+RAW_TEXT_MAX_CHARS = 500
+
 
 class PostGenerator:
     """Generate LinkedIn posts using Claude API or fallback templates."""
@@ -60,8 +63,11 @@ class PostGenerator:
 
         # Add context from raw article if available
         if announcement.get('raw_text'):
-            # Truncate to avoid token limits
-            raw_text = announcement['raw_text'][:500]
+            # Truncate to avoid token limits, after collapsing whitespace so
+            # runs of blanks do not use up the budget, at a word boundary
+            raw_text = " ".join(announcement['raw_text'].split())
+            if len(raw_text) > RAW_TEXT_MAX_CHARS:
+                raw_text = raw_text[:RAW_TEXT_MAX_CHARS + 1].rsplit(" ", 1)[0][:RAW_TEXT_MAX_CHARS]
             parts.append("")
             parts.append(f"Article excerpt: {raw_text}")
 
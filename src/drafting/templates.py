@@ -3,7 +3,8 @@ Fallback LinkedIn post templates for People on the Move.
 Used when Claude API is unavailable.
 """
 import random
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 # Template variations for different actions
 TEMPLATES = {
@@ -60,8 +61,9 @@ DEFAULT_HASHTAGS = [
 ]
 
 
+@lru_cache(maxsize=4096)
 def format_hashtags(company_name: str = None, count: int = 5) -> str:
-    """Generate hashtag string."""
+    """Generate hashtag string (cached; it only depends on the arguments)."""
     hashtags = DEFAULT_HASHTAGS[:count]
 
     # Add company-specific hashtag if possible
@@ -80,6 +82,12 @@ def format_hashtags(company_name: str = None, count: int = 5) -> str:
 
 def select_template(action: str = None) -> str:
     """Select a random template based on action type."""
+    return random.choice(_templates_for_action(action))
+
+
+@lru_cache(maxsize=256)
+def _templates_for_action(action: str = None) -> Tuple[str, ...]:
+    """Templates for an action, normalized the first time it is seen."""
     # Normalize action
     if action:
         action = action.lower()
@@ -94,8 +102,7 @@ def select_template(action: str = None) -> str:
     else:
         action = 'default'
 
-    templates = TEMPLATES.get(action, TEMPLATES['default'])
-    return random.choice(templates)
+    return tuple(TEMPLATES.get(action, TEMPLATES['default']))
 
 
 def generate_post_from_template(announcement: Dict) -> str:
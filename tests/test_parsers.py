@@ -0,0 +1,14 @@
+"""Tests for article parsing."""
+from src.aggregator.parsers import ArticleParser
+
+
+def test_clean_html_strips_xml_declaration():
+    parser = ArticleParser()
+    html = '<?xml version="1.0" encoding="utf-8"?><p>John Smith named CEO</p>'
+    assert parser.clean_html(html) == 'John Smith named CEO'
+
+
+def test_clean_html_markup_only():
+    parser = ArticleParser()
+    assert parser.clean_html('<?xml version="1.0" encoding="utf-8"?>') == ''
+    assert parser.clean_html('<!-- comment -->') == ''